@@ -68,11 +68,14 @@ MAGIC_NUMBER = 987654321
 LOG_LEVEL = "INFO"              # DEBUG, INFO, WARNING, ERROR
 LOG_TO_FILE = True              # Enable file logging
 LOG_TO_TELEGRAM = False         # Enable Telegram notifications
+LOG_FLUSH_INTERVAL_MS = 50      # Controller log buffer flush interval
+LOG_BUFFER_MAX = 10000          # Max queued log messages before oldest are dropped
 
 # GUI UPDATE INTERVALS
 MARKET_DATA_UPDATE_MS = 1000    # Market data update interval
 GUI_REFRESH_MS = 1000           # GUI refresh interval
 POSITION_UPDATE_MS = 5000       # Position update interval
+MONITOR_REFRESH_MS = 2000       # Account + position monitor interval (coarse timer)
 
 # VALIDATION SETTINGS
 VALIDATE_ORDERS = True          # Enable order validation
@@ -6,15 +6,19 @@ Complete fixes for MT5 connection and auto-trading
 import sys
 import logging
 import threading
-from datetime import datetime, time, timedelta
+import time
+from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 import csv
+import shutil
 import traceback
+import types
+from collections import deque
 import pytz
 import numpy as np
 
-from PySide6.QtCore import QObject, QTimer, Signal, QThread, QMutex
+from PySide6.QtCore import Qt, QObject, QTimer, Signal, QThread, QMutex
 from PySide6.QtWidgets import QMessageBox
 
 # Import configuration
@@ -35,14 +39,14 @@ except ImportError:
 # Import indicators
 from indicators import TechnicalIndicators
 
+# Log level bits - unknown levels map to ERROR so they are never filtered
+_LOG_LEVEL_BITS = {'DEBUG': 1, 'INFO': 2, 'WARNING': 4, 'ERROR': 8}
+
 class AnalysisWorker(QThread):
     """Enhanced Analysis Worker for real-time trading signals"""
 
-    # Signals
-    heartbeat_signal = Signal(str)
-    signal_ready = Signal(dict)
-    indicators_ready = Signal(dict)
-    tick_data_signal = Signal(dict)
+    # Signals - one batched payload per cycle: {'hb', 'tick', 'indicators', 'signal'}
+    cycle_signal = Signal(dict)
     error_signal = Signal(str)
 
     def __init__(self, controller):
@@ -51,6 +55,10 @@ class AnalysisWorker(QThread):
         self.running = False
         self.indicators = TechnicalIndicators()
         self.last_m1_time = None
+        # Last analysis per timeframe: {timeframe: (cache_key, result)}, see analyze_timeframe
+        self._analysis_cache = {}
+        # EMA/RSI/ATR state at the last closed bar: {timeframe: (key, state)}, see closed_bar_state
+        self._closed_bar_state = {}
         self.logger = logging.getLogger(__name__)
 
         # Remove demo mode completely
@@ -66,12 +74,17 @@ class AnalysisWorker(QThread):
             while self.running:
                 current_time = datetime.now(pytz.timezone('Asia/Jakarta'))
 
-                # MANDATORY: Check MT5 connection first
-                if not self.controller.is_connected or not MT5_AVAILABLE:
-                    self.heartbeat_signal.emit(f"[HB] WAITING MT5 CONNECTION t={current_time.strftime('%H:%M:%S')}")
+                # MANDATORY: Check MT5 connection first (is_connected implies MT5_AVAILABLE)
+                if not self.controller.is_connected:
+                    self.cycle_signal.emit({
+                        'hb': f"[HB] WAITING MT5 CONNECTION t={current_time.strftime('%H:%M:%S')}",
+                        'tick': None, 'indicators': None, 'signal': None
+                    })
                     self.msleep(1000)
                     continue
 
+                cycle = {'hb': None, 'tick': None, 'indicators': None, 'signal': None}
+
                 try:
                     # 1. Heartbeat with connection verification
                     if not self.verify_mt5_connection():
@@ -79,42 +92,41 @@ class AnalysisWorker(QThread):
                         self.msleep(2000)
                         continue
 
-                    # 2. Market data analysis
-                    market_data = self.get_market_data()
-                    if market_data:
-                        self.tick_data_signal.emit(market_data)
+                    # 2. Market data analysis - one tick read shared by the whole cycle
+                    tick = mt5.symbol_info_tick(self.controller.config['symbol'])
+                    market_data = self.get_market_data(tick)
+                    cycle['tick'] = market_data
 
                     # 3. Technical analysis
                     analysis_result = self.perform_technical_analysis()
-                    if analysis_result:
-                        self.indicators_ready.emit(analysis_result)
+                    cycle['indicators'] = analysis_result
 
                     # 4. Signal generation
-                    signal = self.generate_trading_signal(analysis_result)
+                    signal = self.generate_trading_signal(analysis_result, tick, market_data)
                     if signal and signal.get('side'):
                         # Cooldown check
                         if (time.time() - self.last_signal_time) > self.signal_cooldown:
-                            self.signal_ready.emit(signal)
+                            cycle['signal'] = signal
                             self.last_signal_time = time.time()
 
                     # 5. Heartbeat log
                     spread = market_data.get('spread_points', 0) if market_data else 0
                     signal_status = signal.get('side', 'NONE') if signal else 'NONE'
-                    self.heartbeat_signal.emit(
-                        f"[HB] LIVE t={current_time.strftime('%H:%M:%S')} spread={spread}pts signal={signal_status}"
-                    )
+                    cycle['hb'] = f"[HB] LIVE t={current_time.strftime('%H:%M:%S')} spread={spread}pts signal={signal_status}"
 
                 except Exception as e:
-                    error_msg = f"Analysis error: {e}"
-                    self.error_signal.emit(error_msg)
-                    self.logger.error(error_msg)
+                    self.error_signal.emit(f"Analysis error: {e}")
+                    self.logger.exception("Analysis error")
+
+                # Single cross-thread emission with everything produced this cycle
+                self.cycle_signal.emit(cycle)
 
                 self.msleep(1000)  # 1 second cycle
 
         except Exception as e:
-            error_msg = f"Analysis worker fatal error: {e}\n{traceback.format_exc()}"
-            self.error_signal.emit(error_msg)
-            self.logger.error(error_msg)
+            # Traceback goes to the logger (formatted only by its handlers), GUI gets the summary
+            self.error_signal.emit(f"Analysis worker fatal error: {e}")
+            self.logger.exception("Analysis worker fatal error")
 
     def verify_mt5_connection(self):
         """Verify MT5 connection is still active"""
@@ -125,13 +137,9 @@ class AnalysisWorker(QThread):
         except:
             return False
 
-    def get_market_data(self):
-        """Get current market data from MT5"""
+    def get_market_data(self, tick):
+        """Build market data snapshot from the cycle's MT5 tick"""
         try:
-            symbol = self.controller.config['symbol']
-
-            # Get current tick
-            tick = mt5.symbol_info_tick(symbol)
             if not tick:
                 return None
 
@@ -143,6 +151,7 @@ class AnalysisWorker(QThread):
                 'bid': tick.bid,
                 'ask': tick.ask,
                 'last': tick.last,
+                'point': point,
                 'spread_points': spread_points,
                 'time': datetime.now()
             }
@@ -160,7 +169,10 @@ class AnalysisWorker(QThread):
             rates_m1 = mt5.copy_rates_from_pos(symbol, mt5.TIMEFRAME_M1, 0, 200)
             rates_m5 = mt5.copy_rates_from_pos(symbol, mt5.TIMEFRAME_M5, 0, 200)
 
-            if rates_m1 is None or rates_m5 is None or len(rates_m1) < 50:
+            # Warmup: enough bars so every indicator's last value is finite
+            min_bars = self.required_bars()
+            if (rates_m1 is None or rates_m5 is None or
+                    len(rates_m1) < min_bars or len(rates_m5) < min_bars):
                 return None
 
             # M1 Analysis
@@ -181,41 +193,94 @@ class AnalysisWorker(QThread):
             self.logger.error(f"Technical analysis error: {e}")
             return None
 
+    def required_bars(self):
+        """Minimum bars needed before all indicators are seeded"""
+        config = self.controller.config
+        # +1: the closed bars alone must seed every indicator, the forming bar is stepped on top
+        return 1 + max(
+            max(config['ema_periods'].values()),
+            config['rsi_period'] + 1,
+            config['atr_period'] + 1,
+            50
+        )
+
+    def closed_bar_state(self, close, high, low, config):
+        """Recursion state of the EMAs, RSI and ATR at the last of the given (closed) bars"""
+        indicators = self.indicators
+        ema_periods = config['ema_periods']
+        avg_gain, avg_loss = indicators.rsi_averages(close, config['rsi_period'])
+        return {
+            'ema_fast': float(indicators.ema(close, ema_periods['fast'])[-1]),
+            'ema_medium': float(indicators.ema(close, ema_periods['medium'])[-1]),
+            'ema_slow': float(indicators.ema(close, ema_periods['slow'])[-1]),
+            'avg_gain': avg_gain,
+            'avg_loss': avg_loss,
+            'atr': float(indicators.atr(high, low, close, config['atr_period'])[-1]),
+            'close': float(close[-1]),
+        }
+
     def analyze_timeframe(self, rates, timeframe):
         """Analyze single timeframe with all indicators"""
         try:
-            close = rates['close']
-            high = rates['high']
-            low = rates['low']
-            volume = rates['tick_volume']
-
-            # Calculate indicators
-            ema_fast = self.indicators.ema(close, self.controller.config['ema_periods']['fast'])
-            ema_medium = self.indicators.ema(close, self.controller.config['ema_periods']['medium'])
-            ema_slow = self.indicators.ema(close, self.controller.config['ema_periods']['slow'])
-            rsi = self.indicators.rsi(close, self.controller.config['rsi_period'])
-            atr = self.indicators.atr(high, low, close, self.controller.config['atr_period'])
-
-            # Get latest values safely
-            return {
-                'ema_fast': ema_fast[-1] if len(ema_fast) > 0 and not np.isnan(ema_fast[-1]) else close[-1],
-                'ema_medium': ema_medium[-1] if len(ema_medium) > 0 and not np.isnan(ema_medium[-1]) else close[-1],
-                'ema_slow': ema_slow[-1] if len(ema_slow) > 0 and not np.isnan(ema_slow[-1]) else close[-1],
-                'rsi': rsi[-1] if len(rsi) > 0 and not np.isnan(rsi[-1]) else 50,
-                'atr': atr[-1] if len(atr) > 0 and not np.isnan(atr[-1]) else 0.01,
-                'close': close[-1],
-                'high': high[-1],
-                'low': low[-1],
-                'volume': volume[-1],
-                'rates': rates,
+            # Resolve config once per call
+            config = self.controller.config
+            ema_periods = config['ema_periods']
+            indicators = self.indicators
+
+            # Same forming bar, same prices, same symbol and periods -> same indicators; skip recompute.
+            # The symbol is part of the key: bar times are identical across symbols
+            last_bar = rates[-1]
+            cache_key = (
+                int(last_bar['time']), float(last_bar['close']), float(last_bar['high']),
+                float(last_bar['low']), int(last_bar['tick_volume']),
+                config['symbol'],
+                ema_periods['fast'], ema_periods['medium'], ema_periods['slow'],
+                config['rsi_period'], config['atr_period']
+            )
+            cached = self._analysis_cache.get(timeframe)
+            if cached is not None and cached[0] == cache_key:
+                return cached[1]
+
+            # Closed bars only change when a bar opens (same window start and end, same symbol and periods);
+            # until then only the forming bar is stepped onto their saved recursion state
+            closed_key = (int(rates[0]['time']), int(rates[-2]['time'])) + cache_key[5:]
+            state = self._closed_bar_state.get(timeframe)
+            if state is None or state[0] != closed_key:
+                # Strided record fields -> contiguous float64 once, shared by every indicator call
+                close = np.ascontiguousarray(rates['close'][:-1], dtype=np.float64)
+                high = np.ascontiguousarray(rates['high'][:-1], dtype=np.float64)
+                low = np.ascontiguousarray(rates['low'][:-1], dtype=np.float64)
+                state = (closed_key, self.closed_bar_state(close, high, low, config))
+                self._closed_bar_state[timeframe] = state
+            closed = state[1]
+
+            # Latest values are finite: bars already passed required_bars()
+            # Plain scalars only - the full rates array is not shipped with the signal
+            last_close = float(last_bar['close'])
+            last_high = float(last_bar['high'])
+            last_low = float(last_bar['low'])
+            result = {
+                'ema_fast': indicators.ema_step(closed['ema_fast'], last_close, ema_periods['fast']),
+                'ema_medium': indicators.ema_step(closed['ema_medium'], last_close, ema_periods['medium']),
+                'ema_slow': indicators.ema_step(closed['ema_slow'], last_close, ema_periods['slow']),
+                'rsi': indicators.rsi_step(closed['avg_gain'], closed['avg_loss'], closed['close'],
+                                           last_close, config['rsi_period']),
+                'atr': indicators.atr_step(closed['atr'], closed['close'], last_high, last_low,
+                                           config['atr_period']),
+                'close': last_close,
+                'high': last_high,
+                'low': last_low,
+                'volume': int(last_bar['tick_volume']),
                 'timeframe': timeframe
             }
+            self._analysis_cache[timeframe] = (cache_key, result)
+            return result
 
         except Exception as e:
             self.logger.error(f"Timeframe analysis error: {e}")
             return {}
 
-    def generate_trading_signal(self, analysis):
+    def generate_trading_signal(self, analysis, tick, market_data):
         """Enhanced signal generation with professional scalping strategy"""
         try:
             if not analysis or 'M1' not in analysis or 'M5' not in analysis:
@@ -224,14 +289,12 @@ class AnalysisWorker(QThread):
             m1 = analysis['M1']
             m5 = analysis['M5']
 
-            # Get current market data
-            symbol = self.controller.config['symbol']
-            tick = mt5.symbol_info_tick(symbol)
-            if not tick:
+            if not tick or not market_data:
                 return {'side': None, 'reason': 'no_tick_data'}
 
-            point = getattr(self.controller.symbol_info, 'point', 0.01)
-            spread_points = round((tick.ask - tick.bid) / point)
+            # Reuse the cycle's market snapshot instead of re-deriving from the tick
+            point = market_data['point']
+            spread_points = market_data['spread_points']
 
             # ENHANCED SCALPING STRATEGY
             signal = self.evaluate_scalping_strategy(m1, m5, tick, spread_points, point)
@@ -377,6 +440,11 @@ class AnalysisWorker(QThread):
 class BotController(QObject):
     """Enhanced MT5 Scalping Bot Controller - REAL TRADING ONLY"""
 
+    # Fixed diagnostic lines as (message, level), indexed by check result (False, True)
+    _DIAG_MT5_MODULE = (("MT5 Module: ❌ Missing", "INFO"), ("MT5 Module: ✅ Available", "INFO"))
+    _DIAG_CONNECTION = (("Connection: ❌ Disconnected", "INFO"), ("Connection: ✅ Connected", "INFO"))
+    _DIAG_ANALYSIS = (("Analysis: ❌ Stopped", "WARNING"), ("Analysis: ✅ Running", "INFO"))
+
     # Signals for GUI updates
     signal_log = Signal(str, str)
     signal_status = Signal(str)
@@ -390,6 +458,22 @@ class BotController(QObject):
         super().__init__()
         self.logger = logging.getLogger(__name__)
 
+        # Log buffer - log_message only enqueues, _flush_logs delivers in batches.
+        # No lock: deque.append/popleft are atomic, producers never block each other
+        # Bounded: under overload the oldest messages are dropped and counted
+        self._log_buffer = deque(maxlen=LOG_BUFFER_MAX)
+        self._dropped_logs = 0
+        # (epoch second, 'HH:MM:SS') - strftime runs at most once per second
+        self._log_ts_cache = (0, '')
+        self._log_flush_timer = QTimer()
+        self._log_flush_timer.setInterval(LOG_FLUSH_INTERVAL_MS)
+        self._log_flush_timer.timeout.connect(self._flush_logs)
+        self._log_flush_timer.start()
+
+        # Enabled levels: LOG_LEVEL and everything above it
+        min_level_bit = _LOG_LEVEL_BITS.get(LOG_LEVEL, _LOG_LEVEL_BITS['INFO'])
+        self._log_level_mask = sum(bit for bit in _LOG_LEVEL_BITS.values() if bit >= min_level_bit)
+
         # Bot state
         self.is_connected = False
         self.is_running = False
@@ -409,6 +493,8 @@ class BotController(QObject):
             'execution_rate': 0.0,
             'last_execution': 'Never'
         }
+        # Read-only live view handed out by get_execution_stats (no per-call copy)
+        self._execution_stats_view = types.MappingProxyType(self.execution_stats)
 
         # Enhanced configuration
         self.config = {
@@ -435,6 +521,13 @@ class BotController(QObject):
             'magic_number': 987654321
         }
 
+        # Hot-path mirror of config['max_trades_per_day'] (kept in sync by set_config)
+        self._max_trades_per_day = self.config['max_trades_per_day']
+
+        # Single-slot MRU for get_config (invalidated by set_config/update_config)
+        self._cfg_last_key = None
+        self._cfg_last_val = None
+
         # Trading state
         self.daily_trades = 0
         self.daily_pnl = 0.0
@@ -447,18 +540,19 @@ class BotController(QObject):
         self.current_indicators = {'M1': {}, 'M5': {}}
         self.account_info = None
         self.positions = []
+        self._positions_sig = None  # last published position set, see update_positions
+        self._trade_refresh_pending = False  # coalesces post-trade refreshes, see _schedule_trade_refresh
         self.symbol_info = None
 
         # Workers and timers
         self.analysis_worker = None
         self.data_mutex = QMutex()
 
-        # Real-time timers
-        self.account_timer = QTimer()
-        self.account_timer.timeout.connect(self.update_account_info)
-
-        self.position_timer = QTimer()
-        self.position_timer.timeout.connect(self.update_positions)
+        # Real-time monitoring - one coarse timer drives account + positions
+        self._ui_refresh_timer = QTimer()
+        self._ui_refresh_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self._ui_refresh_timer.setInterval(MONITOR_REFRESH_MS)
+        self._ui_refresh_timer.timeout.connect(self._refresh_ui)
 
         # Initialize logging
         self.setup_logging()
@@ -483,21 +577,79 @@ class BotController(QObject):
         except Exception as e:
             print(f"Logging setup error: {e}")
 
-    def log_message(self, message: str, level: str = "INFO"):
-        """Enhanced log message with threading safety"""
+    def log_message(self, message: str, level: str = "INFO", exc_info=None):
+        """Enhanced log message with threading safety - buffered, see _flush_logs"""
+        if not self._log_level_mask & _LOG_LEVEL_BITS.get(level, 8):
+            return
         try:
-            timestamp = datetime.now().strftime('%H:%M:%S')
+            now_s = int(time.time())
+            cached_s, timestamp = self._log_ts_cache
+            if now_s != cached_s:
+                timestamp = time.strftime('%H:%M:%S', time.localtime(now_s))
+                self._log_ts_cache = (now_s, timestamp)
             formatted_message = f"[{timestamp}] {message}"
-            self.signal_log.emit(formatted_message, level)
-
-            # Console logging for debugging
-            print(f"[{level}] {formatted_message}")
+            # Console line is pre-encoded here so the flush is a single bytes write
+            console_line = f"[{level}] {formatted_message}\n".encode('utf-8', 'replace')
+            if len(self._log_buffer) == LOG_BUFFER_MAX:
+                self._dropped_logs += 1
+            self._log_buffer.append((formatted_message, level, console_line, exc_info))
 
         except Exception as e:
             print(f"Log emit error: {e}")
 
+    def log_message_lazy(self, level: str, fmt: str, *args):
+        """Log message formatted with fmt % args only when the level is enabled"""
+        if self._log_level_mask & _LOG_LEVEL_BITS.get(level, 8):
+            self.log_message(fmt % args, level)
+
+    def _log_exc(self, message: str, exc: Exception, level: str = "ERROR"):
+        """Log an exception - the traceback is only formatted at flush time"""
+        self.log_message(f"{message}: {exc}", level, (type(exc), exc, exc.__traceback__))
+
+    def _flush_logs(self):
+        """Deliver buffered log messages to GUI and console in one pass"""
+        try:
+            # Single consumer: take what is queued now, later appends wait for next flush
+            if self._dropped_logs:
+                dropped, self._dropped_logs = self._dropped_logs, 0
+                self.log_message(f"⚠️ {dropped} log messages dropped (buffer full)", "WARNING")
+
+            buffer = self._log_buffer
+            pending = len(buffer)
+            if not pending:
+                return
+            popleft = buffer.popleft
+            entries = [popleft() for _ in range(pending)]
+
+            console_lines = []
+            for formatted_message, level, console_line, exc_info in entries:
+                if exc_info is not None:
+                    # Deferred traceback formatting, see _log_exc
+                    trace = ''.join(traceback.format_exception(*exc_info)).rstrip()
+                    formatted_message = f"{formatted_message}\n{trace}"
+                    console_line = f"[{level}] {formatted_message}\n".encode('utf-8', 'replace')
+                self.signal_log.emit(formatted_message, level)
+                console_lines.append(console_line)
+
+            # Console logging for debugging - one bytes write for the whole batch
+            console_bytes = b''.join(console_lines)
+            stdout_buffer = getattr(sys.stdout, 'buffer', None)
+            if stdout_buffer is not None:
+                sys.stdout.flush()
+                stdout_buffer.write(console_bytes)
+                stdout_buffer.flush()
+            else:
+                sys.stdout.write(console_bytes.decode('utf-8', 'replace'))
+
+        except Exception as e:
+            print(f"Log flush error: {e}")
+
     def connect_mt5(self) -> bool:
         """Enhanced MT5 connection with multiple strategies"""
+        return self.connect_terminal() and self.activate_connection()
+
+    def connect_terminal(self) -> bool:
+        """Blocking MT5 handshake (init, account, symbol) - safe to run off the GUI thread"""
         try:
             if not MT5_AVAILABLE:
                 self.log_message("❌ CANNOT CONNECT: MetaTrader5 module not installed", "ERROR")
@@ -545,7 +697,6 @@ class BotController(QObject):
                 self.log_message("🔄 Force reset and final attempt...", "INFO")
                 try:
                     mt5.shutdown()
-                    import time
                     time.sleep(2)
 
                     if mt5.initialize():
@@ -596,24 +747,32 @@ class BotController(QObject):
 
             # Log symbol specifications
             self.log_symbol_specs()
+            return True
 
-            # Connection successful
+        except Exception as e:
+            self._log_exc("MT5 connection critical error", e)
+            return False
+
+    def activate_connection(self) -> bool:
+        """Go live after connect_terminal: start worker and monitor timer (GUI thread only)"""
+        try:
+            # Connection successful - only reachable with MT5_AVAILABLE, so the
+            # per-tick paths gate on is_connected alone
             self.is_connected = True
             self.log_message("🎉 MT5 CONNECTION SUCCESSFUL!", "INFO")
 
             # Start analysis worker
             self.start_analysis_worker()
 
-            # Start monitoring timers
-            self.account_timer.start(1000)   # 1 second
-            self.position_timer.start(500)   # 0.5 seconds
+            # Start monitoring timer - first refresh always publishes positions
+            self._positions_sig = None
+            self._ui_refresh_timer.start()
 
             self.log_message("✅ REAL-TIME MONITORING ACTIVE", "INFO")
             return True
 
         except Exception as e:
-            error_msg = f"MT5 connection critical error: {e}\n{traceback.format_exc()}"
-            self.log_message(error_msg, "ERROR")
+            self._log_exc("MT5 connection critical error", e)
             return False
 
     def start_analysis_worker(self):
@@ -628,11 +787,7 @@ class BotController(QObject):
             self.analysis_worker = AnalysisWorker(self)
 
             # Connect signals
-            self.analysis_worker.heartbeat_signal.connect(
-                lambda msg: self.log_message(msg, "INFO"))
-            self.analysis_worker.signal_ready.connect(self.handle_trading_signal)
-            self.analysis_worker.indicators_ready.connect(self.handle_indicators_update)
-            self.analysis_worker.tick_data_signal.connect(self.handle_tick_data)
+            self.analysis_worker.cycle_signal.connect(self.handle_worker_cycle)
             self.analysis_worker.error_signal.connect(
                 lambda msg: self.log_message(msg, "ERROR"))
 
@@ -643,6 +798,17 @@ class BotController(QObject):
         except Exception as e:
             self.log_message(f"Analysis worker error: {e}", "ERROR")
 
+    def handle_worker_cycle(self, cycle):
+        """Demultiplex one batched analysis cycle from the worker"""
+        if cycle['tick']:
+            self.handle_tick_data(cycle['tick'])
+        if cycle['indicators']:
+            self.handle_indicators_update(cycle['indicators'])
+        if cycle['signal']:
+            self.handle_trading_signal(cycle['signal'])
+        if cycle['hb']:
+            self.log_message(cycle['hb'], "INFO")
+
     def handle_tick_data(self, tick_data):
         """Handle real-time tick data"""
         self.current_market_data = tick_data
@@ -693,8 +859,8 @@ class BotController(QObject):
                 self.log_message(f"🔒 [SHADOW] {signal_side} simulated - Live mode disabled", "INFO")
 
         except Exception as e:
-            error_msg = f"Signal handling error: {e}\n{traceback.format_exc()}"
-            self.log_message(error_msg, "ERROR")
+            self.log_message(f"Signal handling error: {e}", "ERROR")
+            self.logger.exception("Signal handling error")
 
     def execute_enhanced_signal(self, signal):
         """Execute real trading signal with enhanced order management"""
@@ -759,6 +925,7 @@ class BotController(QObject):
 
                 self.daily_trades += 1
                 self.log_trade_to_csv(signal, result, lot_size, sl_price, tp_price)
+                self._schedule_trade_refresh()
                 return True
             else:
                 self.log_message(f"❌ ORDER FAILED: {result.retcode} - {result.comment}", "ERROR")
@@ -882,34 +1049,33 @@ class BotController(QObject):
                    entry_price - (multiplier * fallback_distance))
 
     def check_enhanced_risk_limits(self):
-        """Enhanced risk management checks"""
-        try:
-            # Daily trade limit
-            if self.daily_trades >= self.config['max_trades_per_day']:
-                self.log_message(f"🛡️ Daily trade limit reached: {self.daily_trades}", "WARNING")
-                return False
+        """Enhanced risk management checks - errors surface in handle_trading_signal"""
+        # Daily trade limit
+        if self.daily_trades >= self._max_trades_per_day:
+            self.log_message(f"🛡️ Daily trade limit reached: {self.daily_trades}", "WARNING")
+            return False
 
-            # Consecutive losses limit
-            if self.consecutive_losses >= 3:
-                self.log_message(f"🛡️ Consecutive losses limit: {self.consecutive_losses}", "WARNING")
-                return False
+        # Consecutive losses limit
+        if self.consecutive_losses >= 3:
+            self.log_message(f"🛡️ Consecutive losses limit: {self.consecutive_losses}", "WARNING")
+            return False
 
-            # Account equity check
-            if self.account_info:
-                balance = self.account_info.get('balance', 0)
-                equity = self.account_info.get('equity', 0)
+        # Account equity check
+        if self.account_info:
+            balance = self.account_info.get('balance', 0)
+            equity = self.account_info.get('equity', 0)
 
-                if balance > 0:
-                    drawdown = ((balance - equity) / balance) * 100
-                    if drawdown > 3.0:  # 3% max drawdown
-                        self.log_message(f"🛡️ Drawdown limit exceeded: {drawdown:.1f}%", "WARNING")
-                        return False
+            if balance > 0:
+                drawdown = ((balance - equity) / balance) * 100
+                if drawdown > 3.0:  # 3% max drawdown
+                    self.log_message(f"🛡️ Drawdown limit exceeded: {drawdown:.1f}%", "WARNING")
+                    return False
 
-            return True
+        return True
 
-        except Exception as e:
-            self.log_message(f"Risk check error: {e}", "ERROR")
-            return True
+    def check_risk_limits(self):
+        """Quiet daily trade limit check for GUI status polling"""
+        return self.daily_trades < self._max_trades_per_day
 
     def log_trade_to_csv(self, signal, result, lot_size, sl, tp):
         """Enhanced trade logging"""
@@ -967,8 +1133,7 @@ class BotController(QObject):
             return True
 
         except Exception as e:
-            error_msg = f"Bot start error: {e}"
-            self.log_message(error_msg, "ERROR")
+            self._log_exc("Bot start error", e)
             return False
 
     def stop_bot(self):
@@ -980,6 +1145,7 @@ class BotController(QObject):
                 self.analysis_worker.stop()
 
             self.log_message("🛑 [BOT STOPPED] Analysis and trading halted", "INFO")
+            self._flush_logs()
 
         except Exception as e:
             self.log_message(f"Bot stop error: {e}", "ERROR")
@@ -989,24 +1155,41 @@ class BotController(QObject):
         try:
             self.stop_bot()
 
-            if self.account_timer.isActive():
-                self.account_timer.stop()
-            if self.position_timer.isActive():
-                self.position_timer.stop()
+            if self._ui_refresh_timer.isActive():
+                self._ui_refresh_timer.stop()
+            self._positions_sig = None
 
             if MT5_AVAILABLE:
                 mt5.shutdown()
 
             self.is_connected = False
             self.log_message("🔌 Disconnected from MT5", "INFO")
+            self._flush_logs()
 
         except Exception as e:
             self.log_message(f"Disconnect error: {e}", "ERROR")
 
+    def _refresh_ui(self):
+        """Monitoring tick - account then positions"""
+        self.update_account_info()
+        self.update_positions()
+
+    def _schedule_trade_refresh(self):
+        """Refresh account/positions shortly after a trade - bursts share one refresh"""
+        if not self._trade_refresh_pending:
+            self._trade_refresh_pending = True
+            QTimer.singleShot(10, self._flush_trade_refresh)
+
+    def _flush_trade_refresh(self):
+        """Run the coalesced post-trade refresh"""
+        self._trade_refresh_pending = False
+        if self.is_connected:
+            self._refresh_ui()
+
     def update_account_info(self):
         """Enhanced account monitoring"""
         try:
-            if not self.is_connected or not MT5_AVAILABLE:
+            if not self.is_connected:
                 return
 
             account_info = mt5.account_info()
@@ -1028,14 +1211,22 @@ class BotController(QObject):
     def update_positions(self):
         """Enhanced position monitoring"""
         try:
-            if not self.is_connected or not MT5_AVAILABLE:
+            if not self.is_connected:
                 return
 
             positions = mt5.positions_get(symbol=self.config['symbol'])
             if positions is None:
                 positions = []
 
-            self.positions = []
+            # Publish only when the position set actually changed
+            sig = tuple((pos.ticket, pos.volume, pos.sl, pos.tp, pos.price_current, pos.profit)
+                        for pos in positions)
+            if sig == self._positions_sig:
+                return
+            self._positions_sig = sig
+
+            # Refill in place - the published list keeps a stable identity
+            self.positions.clear()
             for pos in positions:
                 pos_dict = {
                     'ticket': pos.ticket,
@@ -1120,22 +1311,37 @@ class BotController(QObject):
 
     # Utility methods
     def get_execution_stats(self):
-        """Get execution statistics"""
-        return self.execution_stats.copy()
+        """Get execution statistics (read-only view)"""
+        return self._execution_stats_view
 
     def set_config(self, key, value):
         """Set configuration value"""
         self.config[key] = value
+        self._cfg_last_key = None
+        if key == 'max_trades_per_day':
+            self._max_trades_per_day = value
+
+    def update_config(self, values):
+        """Set several configuration values at once"""
+        self.config.update(values)
+        self._cfg_last_key = None
+        if 'max_trades_per_day' in values:
+            self._max_trades_per_day = values['max_trades_per_day']
 
     def get_config(self, key):
-        """Get configuration value"""
-        return self.config.get(key)
+        """Get configuration value - repeated reads of the same key skip the dict lookup"""
+        if key == self._cfg_last_key:
+            return self._cfg_last_val
+        value = self.config.get(key)
+        self._cfg_last_key = key
+        self._cfg_last_val = value
+        return value
 
     def export_logs(self, filename):
         """Export trading logs"""
         try:
-            import shutil
-            shutil.copy(self.csv_file, filename)
+            # copyfile uses the OS fast-copy path (sendfile/fcopyfile) and skips copymode
+            shutil.copyfile(self.csv_file, filename)
             self.log_message(f"📁 Logs exported to: {filename}", "INFO")
             return True
         except Exception as e:
@@ -1148,29 +1354,27 @@ class BotController(QObject):
             self.log_message("=== ENHANCED DIAGNOSTIC CHECK ===", "INFO")
 
             # MT5 module check
-            self.log_message(f"MT5 Module: {'✅ Available' if MT5_AVAILABLE else '❌ Missing'}", "INFO")
+            self.log_message(*self._DIAG_MT5_MODULE[bool(MT5_AVAILABLE)])
 
             # Connection check
-            self.log_message(f"Connection: {'✅ Connected' if self.is_connected else '❌ Disconnected'}", "INFO")
+            self.log_message(*self._DIAG_CONNECTION[bool(self.is_connected)])
 
             # Account check
             if self.account_info:
                 balance = self.account_info.get('balance', 0)
-                self.log_message(f"Account: ✅ Balance ${balance:.2f}", "INFO")
+                self.log_message_lazy("INFO", "Account: ✅ Balance $%.2f", balance)
             else:
                 self.log_message("Account: ❌ No info", "ERROR")
 
             # Symbol check
             if self.symbol_info:
-                self.log_message(f"Symbol: ✅ {self.symbol_info.name}", "INFO")
+                self.log_message_lazy("INFO", "Symbol: ✅ %s", self.symbol_info.name)
             else:
                 self.log_message("Symbol: ❌ Not loaded", "ERROR")
 
             # Worker check
-            if self.analysis_worker and self.analysis_worker.isRunning():
-                self.log_message("Analysis: ✅ Running", "INFO")
-            else:
-                self.log_message("Analysis: ❌ Stopped", "WARNING")
+            worker_running = bool(self.analysis_worker and self.analysis_worker.isRunning())
+            self.log_message(*self._DIAG_ANALYSIS[worker_running])
 
             self.log_message("=== DIAGNOSTIC COMPLETE ===", "INFO")
 
@@ -1216,6 +1420,7 @@ class BotController(QObject):
             if result.retcode == mt5.TRADE_RETCODE_DONE:
                 self.log_message(f"✅ MANUAL {side}: {lot_size} @ {price:.5f}", "INFO")
                 self.daily_trades += 1
+                self._schedule_trade_refresh()
                 return {'success': True, 'ticket': result.order, 'price': result.price}
             else:
                 return {'success': False, 'error': f"{result.retcode} - {result.comment}"}
@@ -1260,6 +1465,7 @@ class BotController(QObject):
             result = mt5.order_send(close_request)
             if result.retcode == mt5.TRADE_RETCODE_DONE:
                 self.log_message(f"✅ Position {ticket} closed", "INFO")
+                self._schedule_trade_refresh()
                 return True
             else:
                 self.log_message(f"❌ Close failed: {result.comment}", "ERROR")
@@ -7,39 +7,371 @@ Perbaikan untuk masalah krusial:
 """
 
 import sys
+import logging
+from collections import deque
+from contextlib import contextmanager
 from datetime import datetime
+from itertools import groupby
+from operator import itemgetter
 from typing import Dict, List, Optional
 
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QTabWidget,
     QLabel, QPushButton, QLineEdit, QSpinBox, QDoubleSpinBox,
-    QComboBox, QCheckBox, QTextEdit, QPlainTextEdit, QTableWidget, QTableWidgetItem,
+    QComboBox, QCheckBox, QPlainTextEdit, QTableView,
     QGroupBox, QFormLayout, QGridLayout, QSplitter, QProgressBar,
     QStatusBar, QMessageBox, QFrame, QFileDialog
 )
-from PySide6.QtCore import Qt, QTimer, Slot, Signal
-from PySide6.QtGui import QFont, QPixmap, QIcon, QColor
+from PySide6.QtCore import (
+    Qt, QObject, QTimer, Slot, Signal, QAbstractTableModel, QModelIndex, QRunnable, QThreadPool
+)
+from PySide6.QtGui import QFont, QPixmap, QIcon, QColor, QTextCharFormat, QTextCursor
+
+# Hot-slot failures go here instead of print() - silent unless the app enables DEBUG
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+class Styles:
+    """Shared stylesheet strings - assigned by reference instead of per-widget literals"""
+    GREEN_BTN_BOLD = "QPushButton { background-color: #4CAF50; color: white; font-weight: bold; }"
+    BLUE_BTN_BOLD = "QPushButton { background-color: #2196F3; color: white; font-weight: bold; }"
+    RED_BTN_BOLD = "QPushButton { background-color: #F44336; color: white; font-weight: bold; }"
+    GREEN_BTN = "QPushButton { background-color: #4CAF50; color: white; }"
+    RED_BTN = "QPushButton { background-color: #F44336; color: white; }"
+    ORANGE_BTN = "QPushButton { background-color: #FF9800; color: white; }"
+    PURPLE_BTN = "QPushButton { background-color: #9C27B0; color: white; }"
+    WARNING_LABEL = "QLabel { color: orange; font-weight: bold; }"
+    INFO_LABEL = "QLabel { color: gray; font-size: 10px; }"
+
+    # Color-coded status labels - chosen per update, never formatted on the hot path
+    GREEN_TEXT = "QLabel { color: green; }"
+    RED_TEXT = "QLabel { color: red; }"
+    ORANGE_TEXT = "QLabel { color: orange; }"
+    GREEN_TEXT_BOLD = "QLabel { color: green; font-weight: bold; }"
+    RED_TEXT_BOLD = "QLabel { color: red; font-weight: bold; }"
+
+    # Window-level rules for labels tagged via setObjectName - parsed once for all of them.
+    # Fonts are shared QFont instances (see MainWindow.__init__), not stylesheet rules
+    WINDOW = "QLabel#indicator_value { color: #2196F3; }"
+
+# Sentinel for single-lookup dict.get in the update slots
+_MISSING = object()
+
+@contextmanager
+def table_updating(table):
+    """Suspend repaints and sorting of a table view for a bulk update"""
+    sorting = table.isSortingEnabled()
+    table.setSortingEnabled(False)
+    table.setUpdatesEnabled(False)
+    try:
+        yield table
+    finally:
+        table.setUpdatesEnabled(True)
+        table.setSortingEnabled(sorting)
+
+class MT5TaskSignals(QObject):
+    """Result channel of an MT5Task - created on the GUI thread, so slots run there"""
+    finished = Signal(object)
+    failed = Signal(str)
+
+class MT5Task(QRunnable):
+    """Run a blocking MT5 or file call on the global QThreadPool"""
+
+    def __init__(self, fn, *args):
+        super().__init__()
+        self.setAutoDelete(False)  # the Python side owns it (and its signals)
+        self.fn = fn
+        self.args = args
+        self.signals = MT5TaskSignals()
+
+    def run(self):
+        try:
+            result = self.fn(*self.args)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
+
+class PositionsModel(QAbstractTableModel):
+    """Open positions table model - rows keyed by ticket, only changed cells are signalled"""
+
+    HEADERS = ("Ticket", "Type", "Volume", "Price", "SL", "TP", "Profit", "Action")
+    PROFIT_COLUMN = 6
+    ACTION_COLUMN = 7
+
+    # Bound cell formatters (same specs as MainWindow.FMT_*)
+    FMT_VOLUME = "{:.2f}".format
+    FMT_PRICE = "{:.5f}".format
+    FMT_MONEY = "${:.2f}".format
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._tickets = []  # ticket per row
+        self._rows = []     # display texts per row
+        self._profits = []  # raw profit per row, drives the profit color
+        self._profit_colors = (QColor('red'), QColor('green'))
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._rows[index.row()][index.column()]
+        if role == Qt.ItemDataRole.ForegroundRole and index.column() == self.PROFIT_COLUMN:
+            return self._profit_colors[self._profits[index.row()] >= 0]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def ticket_at(self, row):
+        """Ticket shown in row, or None"""
+        return self._tickets[row] if 0 <= row < len(self._tickets) else None
+
+    def update_rows(self, positions):
+        """Sync rows with positions, return the row numbers that were inserted"""
+        live_tickets = {pos['ticket'] for pos in positions}
+
+        # Drop rows of closed positions (bottom-up keeps row numbers valid)
+        for row in range(len(self._tickets) - 1, -1, -1):
+            if self._tickets[row] not in live_tickets:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self._tickets[row]
+                del self._rows[row]
+                del self._profits[row]
+                self.endRemoveRows()
+
+        rows = {ticket: row for row, ticket in enumerate(self._tickets)}
+        fmt_volume, fmt_price, fmt_money = self.FMT_VOLUME, self.FMT_PRICE, self.FMT_MONEY
+        inserted = []
+        for pos in positions:
+            ticket = pos['ticket']
+            profit = pos.get('profit', 0)
+            cells = (
+                str(ticket),
+                "BUY" if pos['type'] == 0 else "SELL",
+                fmt_volume(pos['volume']),
+                fmt_price(pos['price_open']),
+                fmt_price(pos.get('sl', 0)),
+                fmt_price(pos.get('tp', 0)),
+                fmt_money(profit),
+                "",
+            )
+
+            row = rows.get(ticket)
+            if row is None:
+                row = len(self._tickets)
+                self.beginInsertRows(QModelIndex(), row, row)
+                self._tickets.append(ticket)
+                self._rows.append(cells)
+                self._profits.append(profit)
+                self.endInsertRows()
+                inserted.append(row)
+                continue
+
+            previous = self._rows[row]
+            changed = [col for col, text in enumerate(cells) if text != previous[col]]
+            if changed:
+                self._rows[row] = cells
+                self._profits[row] = profit
+                self.dataChanged.emit(self.index(row, changed[0]), self.index(row, changed[-1]))
+
+        return inserted
 
 class MainWindow(QMainWindow):
     """Fixed Main Window dengan TP/SL input dinamis"""
 
+    # TP/SL inputs per mode: ((config key, label, spin class, range, default, step, suffix), ...), info
+    TPSL_INPUT_SPECS = {
+        'ATR': (
+            (('atr_multiplier', "📏 ATR Multiplier (SL):", QDoubleSpinBox, (0.5, 5.0), 2.0, 0.1, ""),
+             ('risk_multiple', "🎯 Risk Multiple (TP):", QDoubleSpinBox, (1.0, 5.0), 2.0, 0.1, "")),
+            "SL = max(minSL, ATR × multiplier)\nTP = SL × risk_multiple"
+        ),
+        'Points': (
+            (('tp_points', "🎯 Take Profit:", QSpinBox, (10, 1000), 200, None, " points"),
+             ('sl_points', "🛑 Stop Loss:", QSpinBox, (10, 500), 100, None, " points")),
+            "Direct points distance from entry"
+        ),
+        'Pips': (
+            (('tp_pips', "🎯 Take Profit:", QDoubleSpinBox, (1.0, 100.0), 20.0, None, " pips"),
+             ('sl_pips', "🛑 Stop Loss:", QDoubleSpinBox, (1.0, 50.0), 10.0, None, " pips")),
+            "Pips converted to points based on digits\n(digits 3,5: 1 pip = 10 points)"
+        ),
+        'Balance%': (
+            (('tp_percent', "🎯 TP (% Balance):", QDoubleSpinBox, (0.1, 10.0), 1.0, None, "%"),
+             ('sl_percent', "🛑 SL (% Balance):", QDoubleSpinBox, (0.1, 5.0), 0.5, None, "%")),
+            "USD amount = balance × %\nConverted to points via tick_value"
+        ),
+    }
+
+    # Dirty-tracked labels: field key -> label attribute (see mark_dirty/_flush_dirty)
+    LABEL_FIELDS = {
+        'bid': 'bid_label',
+        'ask': 'ask_label',
+        'spread': 'spread_label',
+        'spread_status': 'spread_status',
+        'last_update': 'last_update_label',
+        'signal_side': 'signal_side_label',
+        'signal_price': 'signal_price_label',
+        'signal_reason': 'signal_reason_label',
+        'signal_timestamp': 'signal_timestamp_label',
+        'balance': 'balance_label',
+        'equity': 'equity_label',
+        'margin': 'margin_label',
+        'pnl': 'pnl_label',
+        'margin_level': 'margin_level_label',
+        'ema_fast_m1': 'ema_fast_m1_label',
+        'ema_medium_m1': 'ema_medium_m1_label',
+        'ema_slow_m1': 'ema_slow_m1_label',
+        'rsi_m1': 'rsi_m1_label',
+        'atr_m1': 'atr_m1_label',
+        'ema_fast_m5': 'ema_fast_m5_label',
+        'ema_medium_m5': 'ema_medium_m5_label',
+        'ema_slow_m5': 'ema_slow_m5_label',
+        'rsi_m5': 'rsi_m5_label',
+        'atr_m5': 'atr_m5_label',
+        'total_positions': 'total_positions_label',
+        'total_volume': 'total_volume_label',
+        'total_profit': 'total_profit_label',
+        'floating_pnl': 'floating_pnl_label',
+        'daily_trades': 'daily_trades_label',
+        'daily_pnl': 'daily_pnl_label',
+        'consecutive_losses': 'consecutive_losses_label',
+        'session_status': 'session_status',
+        'risk_status': 'risk_status',
+    }
+
+    # Pre-bound label formatters (one attribute load + call instead of an f-string per field)
+    FMT_PRICE = "{:.5f}".format
+    FMT_MONEY = "${:.2f}".format
+    FMT_2DP = "{:.2f}".format
+    FMT_PERCENT = "{:.1f}%".format
+    FMT_POINTS = "{} pts".format
+    FMT_CLOCK = "{:02d}:{:02d}:{:02d}".format
+
+    # (timeframe, indicator key, LABEL_FIELDS key, formatter, default) - see apply_indicators
+    INDICATOR_FIELDS = (
+        ('M1', 'ema_fast', 'ema_fast_m1', FMT_PRICE, 0),
+        ('M1', 'ema_medium', 'ema_medium_m1', FMT_PRICE, 0),
+        ('M1', 'ema_slow', 'ema_slow_m1', FMT_PRICE, 0),
+        ('M1', 'rsi', 'rsi_m1', FMT_2DP, 50),
+        ('M1', 'atr', 'atr_m1', FMT_PRICE, 0),
+        ('M5', 'ema_fast', 'ema_fast_m5', FMT_PRICE, 0),
+        ('M5', 'ema_medium', 'ema_medium_m5', FMT_PRICE, 0),
+        ('M5', 'ema_slow', 'ema_slow_m5', FMT_PRICE, 0),
+        ('M5', 'rsi', 'rsi_m5', FMT_2DP, 50),
+        ('M5', 'atr', 'atr_m5', FMT_PRICE, 0),
+    )
+
+    # Controller signal -> MainWindow slot, wired by connect_signals
+    SIGNAL_BINDINGS = (
+        ('signal_log', 'on_log_message'),
+        ('signal_status', 'on_status_update'),
+        ('signal_market_data', 'on_market_data_update'),
+        ('signal_trade_signal', 'on_trade_signal_update'),
+        ('signal_position_update', 'on_position_update'),
+        ('signal_account_update', 'on_account_update'),
+        ('signal_indicators_update', 'on_indicators_update'),
+    )
+
+    # Button enabled flags per UI state - see apply_ui_state
+    BUTTON_STATES = {
+        'DISCONNECTED': {'connect_btn': True, 'disconnect_btn': False, 'start_btn': False, 'stop_btn': False,
+                         'emergency_stop_btn': False, 'manual_buy_btn': False, 'manual_sell_btn': False},
+        'CONNECTING': {'connect_btn': False, 'disconnect_btn': False, 'start_btn': False, 'stop_btn': False,
+                       'emergency_stop_btn': False, 'manual_buy_btn': False, 'manual_sell_btn': False},
+        'CONNECTED': {'connect_btn': False, 'disconnect_btn': True, 'start_btn': True, 'stop_btn': False,
+                      'emergency_stop_btn': True, 'manual_buy_btn': False, 'manual_sell_btn': False},
+        'RUNNING': {'connect_btn': False, 'disconnect_btn': True, 'start_btn': False, 'stop_btn': True,
+                    'emergency_stop_btn': True, 'manual_buy_btn': True, 'manual_sell_btn': True},
+    }
+
+    LOG_MAX_LINES = 5000  # Logs tab line cap
+    LOG_FLUSH_MS = 50     # Logs tab batch interval
+    LOG_COLORS = {'INFO': 'black', 'WARNING': 'orange', 'ERROR': 'red', 'DEBUG': 'blue'}
+    UPDATE_FLUSH_MS = 33  # Tick/signal/indicator refresh interval (~30 Hz)
+    CONFIG_DEBOUNCE_MS = 250  # Quiet time before a symbol change reaches the controller
+
     def __init__(self, controller):
         super().__init__()
         self.controller = controller
         self.setWindowTitle("MT5 Professional Scalping Bot - FIXED VERSION")
         self.setGeometry(100, 100, 1600, 1000)
+        self.setStyleSheet(Styles.WINDOW)
 
         # Initialize all required attributes
         self.connection_status = None
         self.bot_status = None
         self.mode_status = None
 
+        # Shared monospace fonts for value labels - resolved once, not per label
+        self._mono_font = QFont("Courier New")
+        self._mono_font.setPixelSize(12)
+        self._mono_large_font = QFont("Courier New")
+        self._mono_large_font.setPixelSize(14)
+        self._mono_large_font.setBold(True)
+        self._mono_small_font = QFont("Courier New")
+        self._mono_small_font.setPixelSize(11)
+
+        # Current BUTTON_STATES key (None until the first apply_ui_state)
+        self._ui_state = None
+
+        # In-flight background tasks (kept referenced until the next run)
+        self._connect_task = None
+        self._export_task = None
+
         # TP/SL Input widgets (akan dibuat dinamis)
         self.tp_sl_inputs = {}
 
+        # Dirty-set label updates - only changed text reaches QLabel.setText
+        self._field_map = {}
+        self._values = {}
+        self._dirty = set()
+        self._flush_pending = False
+
+        # Last style sheet applied per label - unchanged ones are not re-parsed
+        self._label_styles = {}
+
+        # Pending log lines - written to log_display in one append per LOG_FLUSH_MS
+        self._log_lines = deque(maxlen=self.LOG_MAX_LINES)
+        self.log_display = None  # set when the Logs tab is built
+
+        # Per-level character formats - lines are inserted as plain text, no HTML parsing
+        self._log_formats = {}
+        for level, color in self.LOG_COLORS.items():
+            log_format = QTextCharFormat()
+            log_format.setForeground(QColor(color))
+            self._log_formats[level] = log_format
+        self._log_default_format = self._log_formats['INFO']
+        self._log_flush_pending = False
+
+        # Latest payload per apply method - superseded ones are dropped, applied per UPDATE_FLUSH_MS
+        self._pending_updates = {}
+        self._update_flush_pending = False
+        self._last_tick_hms = None  # (hour, minute, second) shown in last_update
+
+        # Symbol debounce - wheel/arrow scrolling through the combo pushes only the final symbol
+        self.symbol_debounce_timer = QTimer(self)
+        self.symbol_debounce_timer.setSingleShot(True)
+        self.symbol_debounce_timer.setInterval(self.CONFIG_DEBOUNCE_MS)
+        self.symbol_debounce_timer.timeout.connect(self.apply_symbol_change)
+
+        # Tab index -> builder for tabs created on first visit
+        self._lazy_tabs = {}
+
         # Setup UI components
         try:
             self.setup_ui()
+            self._field_map = {key: getattr(self, attr) for key, attr in self.LABEL_FIELDS.items()
+                               if getattr(self, attr, None) is not None}
             self.setup_status_bar()
             self.connect_signals()
 
@@ -67,46 +399,89 @@ class MainWindow(QMainWindow):
             self.tab_widget = QTabWidget()
             layout.addWidget(self.tab_widget)
 
-            # Create all tabs dengan error handling individual
+            # Build all tabs with painting and tab signals suspended - one layout pass at the end
+            self.setUpdatesEnabled(False)
+            self.tab_widget.blockSignals(True)
             try:
-                self.create_dashboard_tab()
-            except Exception as e:
-                print(f"Dashboard tab creation failed: {e}")
+                # Create all tabs dengan error handling individual
+                try:
+                    self.create_dashboard_tab()
+                except Exception as e:
+                    print(f"Dashboard tab creation failed: {e}")
+
+                try:
+                    self.create_strategy_tab()
+                except Exception as e:
+                    print(f"Strategy tab creation failed: {e}")
+
+                try:
+                    self.create_risk_tab()
+                except Exception as e:
+                    print(f"Risk tab creation failed: {e}")
+
+                try:
+                    self.create_execution_tab()
+                except Exception as e:
+                    print(f"Execution tab creation failed: {e}")
+
+                try:
+                    self.create_positions_tab()
+                except Exception as e:
+                    print(f"Positions tab creation failed: {e}")
+
+                # Logs and Tools are not read by anything else - built on first visit
+                self.add_lazy_tab("📝 Logs", self.build_logs_tab)
+                self.add_lazy_tab("🔧 Tools", self.create_tools_tab)
+            finally:
+                self.tab_widget.blockSignals(False)
+                self.setUpdatesEnabled(True)
+
+            self.tab_widget.currentChanged.connect(self.on_tab_changed)
 
-            try:
-                self.create_strategy_tab()
-            except Exception as e:
-                print(f"Strategy tab creation failed: {e}")
-
-            try:
-                self.create_risk_tab()
-            except Exception as e:
-                print(f"Risk tab creation failed: {e}")
-
-            try:
-                self.create_execution_tab()
-            except Exception as e:
-                print(f"Execution tab creation failed: {e}")
-
-            try:
-                self.create_positions_tab()
-            except Exception as e:
-                print(f"Positions tab creation failed: {e}")
-
-            try:
-                self.create_logs_tab()
-            except Exception as e:
-                print(f"Logs tab creation failed: {e}")
-                # Fallback: create simple logs tab
-                self.create_simple_logs_tab()
+        except Exception as e:
+            raise Exception(f"UI setup failed: {e}")
 
-            try:
-                self.create_tools_tab()
-            except Exception as e:
-                print(f"Tools tab creation failed: {e}")
+    def add_lazy_tab(self, title, builder):
+        """Add a placeholder tab whose real page is built on first visit"""
+        index = self.tab_widget.addTab(QWidget(), title)
+        self._lazy_tabs[index] = builder
+
+    @Slot(int)
+    def on_tab_changed(self, index):
+        """Build a lazy tab the first time it becomes current"""
+        builder = self._lazy_tabs.pop(index, None)
+        if builder is None:
+            return
+
+        placeholder = self.tab_widget.widget(index)
+        count = self.tab_widget.count()
+        self.tab_widget.blockSignals(True)
+        try:
+            # Builders append their page at the end - move it over the placeholder
+            builder()
+            if self.tab_widget.count() > count:
+                page = self.tab_widget.widget(count)
+                title = self.tab_widget.tabText(count)
+                self.tab_widget.removeTab(count)
+                self.tab_widget.removeTab(index)
+                self.tab_widget.insertTab(index, page, title)
+                self.tab_widget.setCurrentIndex(index)
+                placeholder.deleteLater()
+        except Exception as e:
+            print(f"Lazy tab creation failed: {e}")
+        finally:
+            self.tab_widget.blockSignals(False)
 
+    def build_logs_tab(self):
+        """Create the logs tab (simple fallback on error) and show queued lines"""
+        try:
+            self.create_logs_tab()
         except Exception as e:
-            raise Exception(f"UI setup failed: {e}")
+            print(f"Logs tab creation failed: {e}")
+            # Fallback: create simple logs tab
+            self.create_simple_logs_tab()
+
+        self._flush_log_lines()
 
     def create_dashboard_tab(self):
         """Create enhanced dashboard with status indicators"""
@@ -119,7 +494,7 @@ class MainWindow(QMainWindow):
             conn_layout = QFormLayout(conn_group)
 
             self.connect_btn = QPushButton("Connect")
-            self.connect_btn.setStyleSheet("QPushButton { background-color: #4CAF50; color: white; font-weight: bold; }")
+            self.connect_btn.setStyleSheet(Styles.GREEN_BTN_BOLD)
 
             self.disconnect_btn = QPushButton("Disconnect")
             self.disconnect_btn.setEnabled(False)
@@ -140,7 +515,7 @@ class MainWindow(QMainWindow):
 
             # Warning label untuk non-XAU symbols
             self.symbol_warning = QLabel("")
-            self.symbol_warning.setStyleSheet("QLabel { color: orange; font-weight: bold; }")
+            self.symbol_warning.setStyleSheet(Styles.WARNING_LABEL)
             self.symbol_warning.setWordWrap(True)
 
             symbol_layout.addRow("Symbol:", self.symbol_combo)
@@ -151,14 +526,14 @@ class MainWindow(QMainWindow):
             control_layout = QFormLayout(control_group)
 
             self.start_btn = QPushButton("Start Bot")
-            self.start_btn.setStyleSheet("QPushButton { background-color: #2196F3; color: white; font-weight: bold; }")
+            self.start_btn.setStyleSheet(Styles.BLUE_BTN_BOLD)
             self.start_btn.setEnabled(False)
 
             self.stop_btn = QPushButton("Stop Bot")
             self.stop_btn.setEnabled(False)
 
             self.emergency_stop_btn = QPushButton("🛑 EMERGENCY STOP")
-            self.emergency_stop_btn.setStyleSheet("QPushButton { background-color: #F44336; color: white; font-weight: bold; }")
+            self.emergency_stop_btn.setStyleSheet(Styles.RED_BTN_BOLD)
             self.emergency_stop_btn.setEnabled(False)
 
             self.shadow_mode_cb = QCheckBox("Shadow Mode (Safe Testing)")
@@ -196,7 +571,7 @@ class MainWindow(QMainWindow):
             # Style market labels
             market_labels = [self.bid_label, self.ask_label, self.spread_label, self.last_update_label]
             for label in market_labels:
-                label.setStyleSheet("QLabel { font-family: 'Courier New'; font-size: 14px; font-weight: bold; }")
+                label.setFont(self._mono_large_font)
 
             market_layout.addRow("💰 Bid:", self.bid_label)
             market_layout.addRow("💸 Ask:", self.ask_label)
@@ -216,7 +591,7 @@ class MainWindow(QMainWindow):
             # Style account labels
             account_labels = [self.balance_label, self.equity_label, self.margin_label, self.pnl_label, self.margin_level_label]
             for label in account_labels:
-                label.setStyleSheet("QLabel { font-family: 'Courier New'; font-size: 12px; }")
+                label.setFont(self._mono_font)
 
             account_layout.addRow("💵 Balance:", self.balance_label)
             account_layout.addRow("💎 Equity:", self.equity_label)
@@ -344,7 +719,8 @@ class MainWindow(QMainWindow):
             ]
 
             for label in indicator_labels:
-                label.setStyleSheet("QLabel { font-family: 'Courier New'; font-size: 11px; color: #2196F3; }")
+                label.setFont(self._mono_small_font)
+                label.setObjectName("indicator_value")
 
             indicators_hlayout = QHBoxLayout()
             indicators_hlayout.addWidget(m1_group)
@@ -449,85 +825,26 @@ class MainWindow(QMainWindow):
 
             self.tp_sl_inputs = {}
 
-            if mode == "ATR":
-                # ATR multiplier for SL, Risk multiple for TP
-                self.tp_sl_inputs['atr_multiplier'] = QDoubleSpinBox()
-                self.tp_sl_inputs['atr_multiplier'].setRange(0.5, 5.0)
-                self.tp_sl_inputs['atr_multiplier'].setValue(2.0)
-                self.tp_sl_inputs['atr_multiplier'].setSingleStep(0.1)
-
-                self.tp_sl_inputs['risk_multiple'] = QDoubleSpinBox()
-                self.tp_sl_inputs['risk_multiple'].setRange(1.0, 5.0)
-                self.tp_sl_inputs['risk_multiple'].setValue(2.0)
-                self.tp_sl_inputs['risk_multiple'].setSingleStep(0.1)
-
-                self.tpsl_inputs_layout.addRow("📏 ATR Multiplier (SL):", self.tp_sl_inputs['atr_multiplier'])
-                self.tpsl_inputs_layout.addRow("🎯 Risk Multiple (TP):", self.tp_sl_inputs['risk_multiple'])
-
-                # Info label
-                info_label = QLabel("SL = max(minSL, ATR × multiplier)\nTP = SL × risk_multiple")
-                info_label.setStyleSheet("QLabel { color: gray; font-size: 10px; }")
-                self.tpsl_inputs_layout.addRow("ℹ️ Info:", info_label)
-
-            elif mode == "Points":
-                # Direct points input
-                self.tp_sl_inputs['tp_points'] = QSpinBox()
-                self.tp_sl_inputs['tp_points'].setRange(10, 1000)
-                self.tp_sl_inputs['tp_points'].setValue(200)
-                self.tp_sl_inputs['tp_points'].setSuffix(" points")
-
-                self.tp_sl_inputs['sl_points'] = QSpinBox()
-                self.tp_sl_inputs['sl_points'].setRange(10, 500)
-                self.tp_sl_inputs['sl_points'].setValue(100)
-                self.tp_sl_inputs['sl_points'].setSuffix(" points")
-
-                self.tpsl_inputs_layout.addRow("🎯 Take Profit:", self.tp_sl_inputs['tp_points'])
-                self.tpsl_inputs_layout.addRow("🛑 Stop Loss:", self.tp_sl_inputs['sl_points'])
-
-                # Info label
-                info_label = QLabel("Direct points distance from entry")
-                info_label.setStyleSheet("QLabel { color: gray; font-size: 10px; }")
-                self.tpsl_inputs_layout.addRow("ℹ️ Info:", info_label)
-
-            elif mode == "Pips":
-                # Pips input (akan dikonversi ke points)
-                self.tp_sl_inputs['tp_pips'] = QDoubleSpinBox()
-                self.tp_sl_inputs['tp_pips'].setRange(1.0, 100.0)
-                self.tp_sl_inputs['tp_pips'].setValue(20.0)
-                self.tp_sl_inputs['tp_pips'].setSuffix(" pips")
-
-                self.tp_sl_inputs['sl_pips'] = QDoubleSpinBox()
-                self.tp_sl_inputs['sl_pips'].setRange(1.0, 50.0)
-                self.tp_sl_inputs['sl_pips'].setValue(10.0)
-                self.tp_sl_inputs['sl_pips'].setSuffix(" pips")
-
-                self.tpsl_inputs_layout.addRow("🎯 Take Profit:", self.tp_sl_inputs['tp_pips'])
-                self.tpsl_inputs_layout.addRow("🛑 Stop Loss:", self.tp_sl_inputs['sl_pips'])
-
-                # Info label
-                info_label = QLabel("Pips converted to points based on digits\n(digits 3,5: 1 pip = 10 points)")
-                info_label.setStyleSheet("QLabel { color: gray; font-size: 10px; }")
-                self.tpsl_inputs_layout.addRow("ℹ️ Info:", info_label)
-
-            elif mode == "Balance%":
-                # Percentage of balance
-                self.tp_sl_inputs['tp_percent'] = QDoubleSpinBox()
-                self.tp_sl_inputs['tp_percent'].setRange(0.1, 10.0)
-                self.tp_sl_inputs['tp_percent'].setValue(1.0)
-                self.tp_sl_inputs['tp_percent'].setSuffix("%")
-
-                self.tp_sl_inputs['sl_percent'] = QDoubleSpinBox()
-                self.tp_sl_inputs['sl_percent'].setRange(0.1, 5.0)
-                self.tp_sl_inputs['sl_percent'].setValue(0.5)
-                self.tp_sl_inputs['sl_percent'].setSuffix("%")
-
-                self.tpsl_inputs_layout.addRow("🎯 TP (% Balance):", self.tp_sl_inputs['tp_percent'])
-                self.tpsl_inputs_layout.addRow("🛑 SL (% Balance):", self.tp_sl_inputs['sl_percent'])
-
-                # Info label
-                info_label = QLabel("USD amount = balance × %\nConverted to points via tick_value")
-                info_label.setStyleSheet("QLabel { color: gray; font-size: 10px; }")
-                self.tpsl_inputs_layout.addRow("ℹ️ Info:", info_label)
+            spec = self.TPSL_INPUT_SPECS.get(mode)
+            if spec is None:
+                return
+
+            fields, info_text = spec
+            for key, label, spin_class, (minimum, maximum), value, step, suffix in fields:
+                spin = spin_class()
+                spin.setRange(minimum, maximum)
+                spin.setValue(value)
+                if step:
+                    spin.setSingleStep(step)
+                if suffix:
+                    spin.setSuffix(suffix)
+                self.tp_sl_inputs[key] = spin
+                self.tpsl_inputs_layout.addRow(label, spin)
+
+            # Info label
+            info_label = QLabel(info_text)
+            info_label.setStyleSheet(Styles.INFO_LABEL)
+            self.tpsl_inputs_layout.addRow("ℹ️ Info:", info_label)
 
         except Exception as e:
             print(f"Setup TP/SL inputs error: {e}")
@@ -550,7 +867,7 @@ class MainWindow(QMainWindow):
             # Style signal labels
             signal_labels = [self.signal_side_label, self.signal_price_label, self.signal_reason_label, self.signal_timestamp_label]
             for label in signal_labels:
-                label.setStyleSheet("QLabel { font-family: 'Courier New'; font-size: 12px; }")
+                label.setFont(self._mono_font)
 
             signal_layout.addRow("📊 Signal:", self.signal_side_label)
             signal_layout.addRow("💰 Entry Price:", self.signal_price_label)
@@ -570,12 +887,12 @@ class MainWindow(QMainWindow):
             self.manual_lot_spin.setSingleStep(0.01)
 
             self.manual_buy_btn = QPushButton("📈 Manual BUY")
-            self.manual_buy_btn.setStyleSheet("QPushButton { background-color: #4CAF50; color: white; }")
+            self.manual_buy_btn.setStyleSheet(Styles.GREEN_BTN)
             self.manual_buy_btn.setEnabled(False)
             self.manual_buy_btn.clicked.connect(self.on_manual_buy)
 
             self.manual_sell_btn = QPushButton("📉 Manual SELL")
-            self.manual_sell_btn.setStyleSheet("QPushButton { background-color: #F44336; color: white; }")
+            self.manual_sell_btn.setStyleSheet(Styles.RED_BTN)
             self.manual_sell_btn.setEnabled(False)
             self.manual_sell_btn.clicked.connect(self.on_manual_sell)
 
@@ -619,15 +936,13 @@ class MainWindow(QMainWindow):
             positions_group = QGroupBox("📊 Open Positions")
             positions_layout = QVBoxLayout(positions_group)
 
-            self.positions_table = QTableWidget()
-            self.positions_table.setColumnCount(8)
-            self.positions_table.setHorizontalHeaderLabels([
-                "Ticket", "Type", "Volume", "Price", "SL", "TP", "Profit", "Action"
-            ])
+            self.positions_model = PositionsModel(self)
+            self.positions_table = QTableView()
+            self.positions_table.setModel(self.positions_model)
 
             # Table styling
             self.positions_table.setAlternatingRowColors(True)
-            self.positions_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+            self.positions_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
 
             positions_layout.addWidget(self.positions_table)
 
@@ -635,10 +950,10 @@ class MainWindow(QMainWindow):
             controls_layout = QHBoxLayout()
 
             self.close_selected_btn = QPushButton("❌ Close Selected")
-            self.close_selected_btn.setStyleSheet("QPushButton { background-color: #FF9800; color: white; }")
+            self.close_selected_btn.setStyleSheet(Styles.ORANGE_BTN)
 
             self.close_all_btn = QPushButton("🚫 Close All Positions")
-            self.close_all_btn.setStyleSheet("QPushButton { background-color: #F44336; color: white; font-weight: bold; }")
+            self.close_all_btn.setStyleSheet(Styles.RED_BTN_BOLD)
 
             self.refresh_positions_btn = QPushButton("🔄 Refresh")
 
@@ -689,7 +1004,7 @@ class MainWindow(QMainWindow):
             self.clear_logs_btn = QPushButton("🗑️ Clear Logs")
             self.export_logs_btn = QPushButton("📥 Export Logs")
             self.diagnostic_btn = QPushButton("🩺 Run Diagnostic")
-            self.diagnostic_btn.setStyleSheet("QPushButton { background-color: #9C27B0; color: white; }")
+            self.diagnostic_btn.setStyleSheet(Styles.PURPLE_BTN)
 
             controls_layout.addWidget(self.clear_logs_btn)
             controls_layout.addWidget(self.export_logs_btn)
@@ -698,9 +1013,10 @@ class MainWindow(QMainWindow):
 
             layout.addLayout(controls_layout)
 
-            # Log display - gunakan QTextEdit yang kompatibel dengan semua method
-            self.log_display = QTextEdit()
+            # Log display - QPlainTextEdit, oldest lines evicted past LOG_MAX_LINES
+            self.log_display = QPlainTextEdit()
             self.log_display.setReadOnly(True)
+            self.log_display.setMaximumBlockCount(self.LOG_MAX_LINES)
             self.log_display.setFont(QFont("Courier New", 10))
             self.log_display.setMaximumHeight(400)  # Limit height instead
 
@@ -723,8 +1039,9 @@ class MainWindow(QMainWindow):
             layout = QVBoxLayout(logs)
 
             # Simple log display tanpa fitur advanced
-            self.log_display = QTextEdit()
+            self.log_display = QPlainTextEdit()
             self.log_display.setReadOnly(True)
+            self.log_display.setMaximumBlockCount(self.LOG_MAX_LINES)
             self.log_display.setFont(QFont("Courier New", 10))
 
             # Basic controls
@@ -822,8 +1139,12 @@ class MainWindow(QMainWindow):
             self.bot_indicator = QLabel("⚪ Stopped")
             self.mode_indicator = QLabel("🔒 Shadow")
 
+            # Controller status text - a plain label repaints asynchronously, unlike showMessage
+            self.status_msg_label = QLabel("🚀 System Ready...")
+
             self.status_bar.addWidget(QLabel("Connection:"))
             self.status_bar.addWidget(self.conn_indicator)
+            self.status_bar.addWidget(self.status_msg_label, 1)
             self.status_bar.addPermanentWidget(QLabel("Bot:"))
             self.status_bar.addPermanentWidget(self.bot_indicator)
             self.status_bar.addPermanentWidget(QLabel("Mode:"))
@@ -836,13 +1157,8 @@ class MainWindow(QMainWindow):
         """Connect controller signals to GUI slots"""
         try:
             if self.controller:
-                self.controller.signal_log.connect(self.on_log_message)
-                self.controller.signal_status.connect(self.on_status_update)
-                self.controller.signal_market_data.connect(self.on_market_data_update)
-                self.controller.signal_trade_signal.connect(self.on_trade_signal_update)
-                self.controller.signal_position_update.connect(self.on_position_update)
-                self.controller.signal_account_update.connect(self.on_account_update)
-                self.controller.signal_indicators_update.connect(self.on_indicators_update)
+                for signal_name, slot_name in self.SIGNAL_BINDINGS:
+                    getattr(self.controller, signal_name).connect(getattr(self, slot_name))
 
         except Exception as e:
             print(f"Signal connection error: {e}")
@@ -861,14 +1177,27 @@ class MainWindow(QMainWindow):
             print(f"Display initialization error: {e}")
 
     # EVENT HANDLERS
+    @Slot()
     def on_connect(self):
-        """Handle connect button with enhanced error messages"""
+        """Handle connect button - the MT5 handshake runs on the thread pool"""
         try:
             self.controller.log_message("🔄 Attempting REAL MT5 connection...", "INFO")
-            
-            if self.controller.connect_mt5():
+            self.apply_ui_state('CONNECTING')
+
+            self._connect_task = MT5Task(self.controller.connect_terminal)
+            self._connect_task.signals.finished.connect(self.on_connect_finished)
+            self._connect_task.signals.failed.connect(self.on_connect_failed)
+            QThreadPool.globalInstance().start(self._connect_task)
+
+        except Exception as e:
+            self.on_connect_failed(str(e))
+
+    @Slot(object)
+    def on_connect_finished(self, connected):
+        """Finish connect on the GUI thread once the handshake returns"""
+        try:
+            if connected and self.controller.activate_connection():
                 self.update_connection_status(True)
-                self.start_btn.setEnabled(True)
                 
                 # Connection successful - always real MT5
                 QMessageBox.information(self, "✅ Connection Success", 
@@ -891,27 +1220,33 @@ class MainWindow(QMainWindow):
                                    "Check logs for detailed error information.")
                 
         except Exception as e:
-            self.update_connection_status(False)
-            error_msg = f"Connection failed: {str(e)}"
-            self.controller.log_message(error_msg, "ERROR")
-            QMessageBox.critical(self, "Connection Error", 
-                               f"Connection failed with error:\n\n{error_msg}\n\n"
-                               "REQUIREMENTS:\n"
-                               "• MetaTrader5 Python module installed\n"
-                               "• MT5 terminal running and logged in\n"
-                               "• Automated trading enabled in MT5\n"
-                               "• Valid trading account with permissions")
+            self.on_connect_failed(str(e))
 
+    @Slot(str)
+    def on_connect_failed(self, error):
+        """Handle an exception raised while connecting"""
+        self.update_connection_status(False)
+        error_msg = f"Connection failed: {error}"
+        self.controller.log_message(error_msg, "ERROR")
+        QMessageBox.critical(self, "Connection Error", 
+                           f"Connection failed with error:\n\n{error_msg}\n\n"
+                           "REQUIREMENTS:\n"
+                           "• MetaTrader5 Python module installed\n"
+                           "• MT5 terminal running and logged in\n"
+                           "• Automated trading enabled in MT5\n"
+                           "• Valid trading account with permissions")
+
+    @Slot()
     def on_disconnect(self):
         """Handle disconnect button"""
         try:
             self.controller.disconnect_mt5()
             self.update_connection_status(False)
             self.update_bot_status(False)
-            self.start_btn.setEnabled(False)
         except Exception as e:
             QMessageBox.critical(self, "Disconnect Error", f"Disconnect failed: {e}")
 
+    @Slot()
     def on_start_bot(self):
         """Handle start bot button"""
         try:
@@ -926,6 +1261,7 @@ class MainWindow(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "Start Error", f"Bot start failed: {e}")
 
+    @Slot()
     def on_stop_bot(self):
         """Handle stop bot button"""
         try:
@@ -934,6 +1270,7 @@ class MainWindow(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "Stop Error", f"Bot stop failed: {e}")
 
+    @Slot()
     def on_emergency_stop(self):
         """Handle emergency stop button"""
         try:
@@ -945,43 +1282,53 @@ class MainWindow(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "Emergency Stop Error", f"Emergency stop failed: {e}")
 
+    @Slot(bool)
     def on_shadow_mode_toggle(self, checked):
         """Handle shadow mode toggle"""
         try:
             self.controller.shadow_mode = checked
             self.mode_indicator.setText("🔒 Shadow" if checked else "⚡ Live")
-            self.mode_indicator.setStyleSheet(f"QLabel {{ color: {'orange' if checked else 'red'}; }}")
+            self.set_style(self.mode_indicator, Styles.ORANGE_TEXT if checked else Styles.RED_TEXT)
         except Exception as e:
             print(f"Shadow mode toggle error: {e}")
 
+    @Slot(str)
     def on_symbol_changed(self, symbol):
-        """Handle symbol change"""
+        """Handle symbol change - restart the debounce, the last symbol wins"""
+        self.check_symbol_warning()
+        self.symbol_debounce_timer.start()
+
+    def apply_symbol_change(self):
+        """Push the settled symbol to the controller"""
         try:
-            self.controller.set_config('symbol', symbol)
-            self.check_symbol_warning()
+            self.controller.set_config('symbol', self.symbol_combo.currentText())
         except Exception as e:
             print(f"Symbol change error: {e}")
 
+    @Slot(str)
     def on_tpsl_mode_changed(self, mode):
         """Handle TP/SL mode change - KRUSIAL"""
         try:
             self.setup_tpsl_inputs(mode)
-            self.controller.set_config('tp_sl_mode', mode)
+
+            # Push mode + its inputs to the controller in one update
+            values = {key: widget.value() for key, widget in self.tp_sl_inputs.items()}
+            values['tp_sl_mode'] = mode
+            self.controller.update_config(values)
         except Exception as e:
             print(f"TP/SL mode change error: {e}")
 
+    @Slot()
     def on_close_selected_position(self):
         """Handle close selected position"""
         try:
-            current_row = self.positions_table.currentRow()
-            if current_row >= 0:
-                ticket_item = self.positions_table.item(current_row, 0)
-                if ticket_item:
-                    ticket = int(ticket_item.text())
-                    self.controller.close_position(ticket)
+            ticket = self.positions_model.ticket_at(self.positions_table.currentIndex().row())
+            if ticket is not None:
+                self.controller.close_position(ticket)
         except Exception as e:
             QMessageBox.critical(self, "Close Position Error", f"Failed to close position: {e}")
 
+    @Slot()
     def on_close_all_positions(self):
         """Handle close all positions"""
         try:
@@ -993,6 +1340,7 @@ class MainWindow(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "Close All Error", f"Failed to close positions: {e}")
 
+    @Slot()
     def on_refresh_positions(self):
         """Handle refresh positions"""
         try:
@@ -1000,6 +1348,7 @@ class MainWindow(QMainWindow):
         except Exception as e:
             print(f"Refresh positions error: {e}")
 
+    @Slot()
     def on_clear_logs(self):
         """Handle clear logs"""
         try:
@@ -1007,16 +1356,34 @@ class MainWindow(QMainWindow):
         except Exception as e:
             print(f"Clear logs error: {e}")
 
+    @Slot()
     def on_export_logs(self):
-        """Handle export logs"""
+        """Handle export logs - the copy runs on QThreadPool, not the GUI thread"""
         try:
             filename, _ = QFileDialog.getSaveFileName(self, "Export Logs", "logs_export.csv", "CSV files (*.csv)")
             if filename:
-                if self.controller.export_logs(filename):
-                    QMessageBox.information(self, "Export", "Logs exported successfully")
+                self.export_logs_btn.setEnabled(False)
+                self._export_task = MT5Task(self.controller.export_logs, filename)
+                self._export_task.signals.finished.connect(self.on_export_finished)
+                self._export_task.signals.failed.connect(self.on_export_failed)
+                QThreadPool.globalInstance().start(self._export_task)
         except Exception as e:
-            QMessageBox.critical(self, "Export Error", f"Failed to export logs: {e}")
+            self.on_export_failed(str(e))
+
+    @Slot(object)
+    def on_export_finished(self, exported):
+        """Handle the result of a background log export"""
+        self.export_logs_btn.setEnabled(True)
+        if exported:
+            QMessageBox.information(self, "Export", "Logs exported successfully")
 
+    @Slot(str)
+    def on_export_failed(self, error):
+        """Handle a failed background log export"""
+        self.export_logs_btn.setEnabled(True)
+        QMessageBox.critical(self, "Export Error", f"Failed to export logs: {error}")
+
+    @Slot()
     def on_run_diagnostic(self):
         """Handle run diagnostic"""
         try:
@@ -1029,179 +1396,213 @@ class MainWindow(QMainWindow):
     def on_log_message(self, message, level):
         """Handle log message dari controller"""
         try:
-            # Color berdasarkan level
-            color_map = {
-                'INFO': 'black',
-                'WARNING': 'orange', 
-                'ERROR': 'red',
-                'DEBUG': 'blue'
-            }
-
-            color = color_map.get(level, 'black')
-            formatted = f'<span style="color: {color};">[{level}] {message}</span>'
-
-            # Use QTextEdit append method which is universal
-            if hasattr(self, 'log_display') and self.log_display:
-                self.log_display.append(f"[{level}] {message}")
-
-                # Auto-scroll to bottom
-                cursor = self.log_display.textCursor()
-                cursor.movePosition(cursor.End)
-                self.log_display.setTextCursor(cursor)
+            # Queue the line - _flush_log_lines writes the batch, colored by level
+            self._log_lines.append((level, f"[{level}] {message}"))
+            if not self._log_flush_pending:
+                self._log_flush_pending = True
+                QTimer.singleShot(self.LOG_FLUSH_MS, self._flush_log_lines)
+
+        except Exception as e:
+            logger.debug("Log message error: %s", e)
+
+    def _flush_log_lines(self):
+        """Append all queued log lines to the log display in one edit block"""
+        try:
+            self._log_flush_pending = False
+            if not self._log_lines or self.log_display is None:
+                return
+
+            entries = list(self._log_lines)
+            self._log_lines.clear()
+
+            # Follow new lines only if the user is already at the bottom
+            scroll_bar = self.log_display.verticalScrollBar()
+            at_bottom = scroll_bar.value() == scroll_bar.maximum()
+
+            # One insertText per run of same-level lines, as a single undo/layout step
+            document = self.log_display.document()
+            cursor = QTextCursor(document)
+            cursor.movePosition(QTextCursor.End)
+            cursor.beginEditBlock()
+            separator = '' if document.isEmpty() else '\n'
+            for level, run in groupby(entries, key=itemgetter(0)):
+                text = '\n'.join(line for _, line in run)
+                cursor.insertText(separator + text, self._log_formats.get(level, self._log_default_format))
+                separator = '\n'
+            cursor.endEditBlock()
+
+            if at_bottom:
+                scroll_bar.setValue(scroll_bar.maximum())
 
         except Exception as e:
-            print(f"Log message error: {e}")
+            logger.debug("Log flush error: %s", e)
 
     @Slot(str)
     def on_status_update(self, status):
         """Handle status update dari controller"""
         try:
-            self.status_bar.showMessage(status, 5000)
+            self.status_msg_label.setText(status)
         except Exception as e:
-            print(f"Status update error: {e}")
+            logger.debug("Status update error: %s", e)
 
     @Slot(dict)
     def on_market_data_update(self, data):
-        """Handle market data update"""
+        """Handle market data update - keep only the latest tick"""
+        self._queue_update(self.apply_market_data, data)
+
+    @Slot(dict)
+    def on_trade_signal_update(self, signal):
+        """Handle trade signal update - keep only the latest signal"""
+        self._queue_update(self.apply_trade_signal, signal)
+
+    @Slot(dict)
+    def on_indicators_update(self, indicators):
+        """Handle indicators update - keep only the latest snapshot"""
+        self._queue_update(self.apply_indicators, indicators)
+
+    def _queue_update(self, apply, payload):
+        """Store the latest payload for apply and arm one flush per UPDATE_FLUSH_MS"""
+        self._pending_updates[apply] = payload
+        if not self._update_flush_pending:
+            self._update_flush_pending = True
+            QTimer.singleShot(self.UPDATE_FLUSH_MS, self._flush_pending_updates)
+
+    def _flush_pending_updates(self):
+        """Apply the latest queued payloads to the labels"""
+        self._update_flush_pending = False
+        pending, self._pending_updates = self._pending_updates, {}
+        for apply, payload in pending.items():
+            apply(payload)
+
+    def apply_market_data(self, data):
+        """Show a market data snapshot"""
         try:
-            if 'bid' in data and 'ask' in data:
-                self.bid_label.setText(f"{data['bid']:.5f}")
-                self.ask_label.setText(f"{data['ask']:.5f}")
+            bid = data.get('bid', _MISSING)
+            ask = data.get('ask', _MISSING)
+            if bid is not _MISSING and ask is not _MISSING:
+                self.mark_dirty('bid', self.FMT_PRICE(bid))
+                self.mark_dirty('ask', self.FMT_PRICE(ask))
 
-            if 'spread_points' in data:
-                self.spread_label.setText(f"{data['spread_points']} pts")
+            spread_points = data.get('spread_points', _MISSING)
+            if spread_points is not _MISSING:
+                self.mark_dirty('spread', self.FMT_POINTS(spread_points))
 
                 # Update spread status
-                max_spread = self.controller.config['max_spread_points']
-                spread_ok = data['spread_points'] <= max_spread
-                self.spread_status.setText("✅ OK" if spread_ok else "❌ Wide")
-                self.spread_status.setStyleSheet(f"QLabel {{ color: {'green' if spread_ok else 'red'}; }}")
-
-            if 'time' in data:
-                self.last_update_label.setText(data['time'].strftime('%H:%M:%S'))
+                max_spread = self.controller.get_config('max_spread_points')
+                spread_ok = spread_points <= max_spread
+                self.mark_dirty('spread_status', "✅ OK" if spread_ok else "❌ Wide")
+                self.set_style(self.spread_status, Styles.GREEN_TEXT if spread_ok else Styles.RED_TEXT)
+
+            # Format the tick clock only when the second changes - no strftime per tick
+            tick_time = data.get('time', _MISSING)
+            if tick_time is not _MISSING:
+                hms = (tick_time.hour, tick_time.minute, tick_time.second)
+                if hms != self._last_tick_hms:
+                    self._last_tick_hms = hms
+                    self.mark_dirty('last_update', self.FMT_CLOCK(*hms))
 
         except Exception as e:
-            print(f"Market data update error: {e}")
+            logger.debug("Market data update error: %s", e)
 
-    @Slot(dict)
-    def on_trade_signal_update(self, signal):
-        """Handle trade signal update"""
+    def apply_trade_signal(self, signal):
+        """Show a trade signal snapshot"""
         try:
-            if signal.get('side'):
-                self.signal_side_label.setText(signal['side'])
-                self.signal_side_label.setStyleSheet(f"QLabel {{ color: {'green' if signal['side'] == 'BUY' else 'red'}; font-weight: bold; }}")
+            side = signal.get('side')
+            if side:
+                self.mark_dirty('signal_side', side)
+                self.set_style(self.signal_side_label, Styles.GREEN_TEXT_BOLD if side == 'BUY' else Styles.RED_TEXT_BOLD)
 
-            if 'entry_price' in signal:
-                self.signal_price_label.setText(f"{signal['entry_price']:.5f}")
+            entry_price = signal.get('entry_price', _MISSING)
+            if entry_price is not _MISSING:
+                self.mark_dirty('signal_price', self.FMT_PRICE(entry_price))
 
-            if 'reason' in signal:
-                self.signal_reason_label.setText(signal['reason'])
+            reason = signal.get('reason', _MISSING)
+            if reason is not _MISSING:
+                self.mark_dirty('signal_reason', reason)
 
-            if 'timestamp' in signal:
-                self.signal_timestamp_label.setText(signal['timestamp'].strftime('%H:%M:%S'))
+            timestamp = signal.get('timestamp', _MISSING)
+            if timestamp is not _MISSING:
+                self.mark_dirty('signal_timestamp', self.FMT_CLOCK(timestamp.hour, timestamp.minute, timestamp.second))
 
         except Exception as e:
-            print(f"Signal update error: {e}")
+            logger.debug("Signal update error: %s", e)
 
     @Slot(list)
     def on_position_update(self, positions):
-        """Handle position update"""
+        """Handle position update - the model diffs rows by ticket"""
         try:
-            # Clear table
-            self.positions_table.setRowCount(0)
+            model = self.positions_model
+            with table_updating(self.positions_table) as table:
+                inserted_rows = model.update_rows(positions)
+
+                # Close button for each new row
+                for row in inserted_rows:
+                    close_btn = QPushButton("❌")
+                    close_btn.clicked.connect(lambda checked, ticket=model.ticket_at(row): self.controller.close_position(ticket))
+                    table.setIndexWidget(model.index(row, model.ACTION_COLUMN), close_btn)
 
             total_volume = 0.0
             total_profit = 0.0
-
-            # Populate table
-            for i, pos in enumerate(positions):
-                self.positions_table.insertRow(i)
-
-                # Populate cells
-                self.positions_table.setItem(i, 0, QTableWidgetItem(str(pos['ticket'])))
-                self.positions_table.setItem(i, 1, QTableWidgetItem("BUY" if pos['type'] == 0 else "SELL"))
-                self.positions_table.setItem(i, 2, QTableWidgetItem(f"{pos['volume']:.2f}"))
-                self.positions_table.setItem(i, 3, QTableWidgetItem(f"{pos['price_open']:.5f}"))
-                self.positions_table.setItem(i, 4, QTableWidgetItem(f"{pos.get('sl', 0):.5f}"))
-                self.positions_table.setItem(i, 5, QTableWidgetItem(f"{pos.get('tp', 0):.5f}"))
-
-                profit = pos.get('profit', 0)
-                profit_item = QTableWidgetItem(f"${profit:.2f}")
-                profit_item.setForeground(QColor('green' if profit >= 0 else 'red'))
-                self.positions_table.setItem(i, 6, profit_item)
-
-                # Close button
-                close_btn = QPushButton("❌")
-                close_btn.clicked.connect(lambda checked, ticket=pos['ticket']: self.controller.close_position(ticket))
-                self.positions_table.setCellWidget(i, 7, close_btn)
-
+            for pos in positions:
                 total_volume += pos['volume']
-                total_profit += profit
+                total_profit += pos.get('profit', 0)
 
             # Update summary
-            self.total_positions_label.setText(str(len(positions)))
-            self.total_volume_label.setText(f"{total_volume:.2f}")
-            self.total_profit_label.setText(f"${total_profit:.2f}")
-            self.floating_pnl_label.setText(f"${total_profit:.2f}")
+            self.mark_dirty('total_positions', str(len(positions)))
+            self.mark_dirty('total_volume', self.FMT_2DP(total_volume))
+            self.mark_dirty('total_profit', self.FMT_MONEY(total_profit))
+            self.mark_dirty('floating_pnl', self.FMT_MONEY(total_profit))
 
-            # Auto-resize columns
-            self.positions_table.resizeColumnsToContents()
+            # Auto-resize columns when rows were added
+            if inserted_rows:
+                self.positions_table.resizeColumnsToContents()
 
         except Exception as e:
-            print(f"Position update error: {e}")
+            logger.debug("Position update error: %s", e)
 
     @Slot(dict)
     def on_account_update(self, account):
         """Handle account update"""
         try:
-            if 'balance' in account:
-                self.balance_label.setText(f"${account['balance']:.2f}")
+            balance = account.get('balance', _MISSING)
+            if balance is not _MISSING:
+                self.mark_dirty('balance', self.FMT_MONEY(balance))
 
-            if 'equity' in account:
-                self.equity_label.setText(f"${account['equity']:.2f}")
+            equity = account.get('equity', _MISSING)
+            if equity is not _MISSING:
+                self.mark_dirty('equity', self.FMT_MONEY(equity))
 
-            if 'margin' in account:
-                self.margin_label.setText(f"${account.get('margin', 0):.2f}")
+            margin = account.get('margin', _MISSING)
+            if margin is not _MISSING:
+                self.mark_dirty('margin', self.FMT_MONEY(margin))
 
-            if 'profit' in account:
-                profit = account['profit']
-                self.pnl_label.setText(f"${profit:.2f}")
-                self.pnl_label.setStyleSheet(f"QLabel {{ color: {'green' if profit >= 0 else 'red'}; }}")
+            profit = account.get('profit', _MISSING)
+            if profit is not _MISSING:
+                self.mark_dirty('pnl', self.FMT_MONEY(profit))
+                self.set_style(self.pnl_label, Styles.GREEN_TEXT if profit >= 0 else Styles.RED_TEXT)
 
             # Calculate margin level
-            margin = account.get('margin', 1)
+            if margin is _MISSING:
+                margin = 1
             if margin > 0:
-                margin_level = (account.get('equity', 0) / margin) * 100
-                self.margin_level_label.setText(f"{margin_level:.1f}%")
+                margin_level = ((0 if equity is _MISSING else equity) / margin) * 100
+                self.mark_dirty('margin_level', self.FMT_PERCENT(margin_level))
 
         except Exception as e:
-            print(f"Account update error: {e}")
+            logger.debug("Account update error: %s", e)
 
-    @Slot(dict)
-    def on_indicators_update(self, indicators):
-        """Handle indicators update"""
+    def apply_indicators(self, indicators):
+        """Show an indicators snapshot"""
         try:
-            # Update M1 indicators
-            if 'M1' in indicators:
-                m1 = indicators['M1']
-                self.ema_fast_m1_label.setText(f"{m1.get('ema_fast', 0):.5f}")
-                self.ema_medium_m1_label.setText(f"{m1.get('ema_medium', 0):.5f}")
-                self.ema_slow_m1_label.setText(f"{m1.get('ema_slow', 0):.5f}")
-                self.rsi_m1_label.setText(f"{m1.get('rsi', 50):.2f}")
-                self.atr_m1_label.setText(f"{m1.get('atr', 0):.5f}")
-
-            # Update M5 indicators
-            if 'M5' in indicators:
-                m5 = indicators['M5']
-                self.ema_fast_m5_label.setText(f"{m5.get('ema_fast', 0):.5f}")
-                self.ema_medium_m5_label.setText(f"{m5.get('ema_medium', 0):.5f}")
-                self.ema_slow_m5_label.setText(f"{m5.get('ema_slow', 0):.5f}")
-                self.rsi_m5_label.setText(f"{m5.get('rsi', 50):.2f}")
-                self.atr_m5_label.setText(f"{m5.get('atr', 0):.5f}")
+            for tf, key, field, fmt, default in self.INDICATOR_FIELDS:
+                values = indicators.get(tf)
+                if values is not None:
+                    self.mark_dirty(field, fmt(values.get(key, default)))
 
         except Exception as e:
-            print(f"Indicators update error: {e}")
+            logger.debug("Indicators update error: %s", e)
 
+    @Slot()
     def on_manual_buy(self):
         """Handle manual BUY order"""
         try:
@@ -1220,6 +1621,7 @@ class MainWindow(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Manual BUY error: {e}")
 
+    @Slot()
     def on_manual_sell(self):
         """Handle manual SELL order"""
         try:
@@ -1280,11 +1682,11 @@ class MainWindow(QMainWindow):
             self.controller.set_config('max_spread_points', self.max_spread_spin.value())
 
             # Strategy config
-            self.controller.config['ema_periods'] = {
+            self.controller.set_config('ema_periods', {
                 'fast': self.ema_fast_spin.value(),
                 'medium': self.ema_medium_spin.value(),
                 'slow': self.ema_slow_spin.value()
-            }
+            })
             self.controller.set_config('rsi_period', self.rsi_period_spin.value())
             self.controller.set_config('atr_period', self.atr_period_spin.value())
             self.controller.set_config('use_rsi_filter', self.rsi_filter_cb.isChecked())
@@ -1307,30 +1709,13 @@ class MainWindow(QMainWindow):
     def update_connection_status(self, connected):
         """Update connection status indicators"""
         try:
-            if connected:
-                if self.connection_status:
-                    self.connection_status.setText("🟢 Connected")
-                if self.conn_indicator:
-                    self.conn_indicator.setText("🟢 Connected")
-                if self.connect_btn:
-                    self.connect_btn.setEnabled(False)
-                if self.disconnect_btn:
-                    self.disconnect_btn.setEnabled(True)
-                if self.emergency_stop_btn:
-                    self.emergency_stop_btn.setEnabled(True)
-            else:
-                if self.connection_status:
-                    self.connection_status.setText("⚪ Disconnected")
-                if self.conn_indicator:
-                    self.conn_indicator.setText("⚪ Disconnected")
-                if self.connect_btn:
-                    self.connect_btn.setEnabled(True)
-                if self.disconnect_btn:
-                    self.disconnect_btn.setEnabled(False)
-                if self.start_btn:
-                    self.start_btn.setEnabled(False)
-                if self.emergency_stop_btn:
-                    self.emergency_stop_btn.setEnabled(False)
+            status_text = "🟢 Connected" if connected else "⚪ Disconnected"
+            if self.connection_status:
+                self.connection_status.setText(status_text)
+            if self.conn_indicator:
+                self.conn_indicator.setText(status_text)
+
+            self.apply_ui_state('CONNECTED' if connected else 'DISCONNECTED')
 
         except Exception as e:
             print(f"Connection status update error: {e}")
@@ -1338,36 +1723,32 @@ class MainWindow(QMainWindow):
     def update_bot_status(self, running):
         """Update bot status indicators"""
         try:
-            if running:
-                if self.bot_status:
-                    self.bot_status.setText("🟢 Running")
-                if self.bot_indicator:
-                    self.bot_indicator.setText("🟢 Running")
-                if self.start_btn:
-                    self.start_btn.setEnabled(False)
-                if self.stop_btn:
-                    self.stop_btn.setEnabled(True)
-                if self.manual_buy_btn:
-                    self.manual_buy_btn.setEnabled(self.controller.is_connected)
-                if self.manual_sell_btn:
-                    self.manual_sell_btn.setEnabled(self.controller.is_connected)
+            status_text = "🟢 Running" if running else "⚪ Stopped"
+            if self.bot_status:
+                self.bot_status.setText(status_text)
+            if self.bot_indicator:
+                self.bot_indicator.setText(status_text)
+
+            if running and self.controller.is_connected:
+                self.apply_ui_state('RUNNING')
             else:
-                if self.bot_status:
-                    self.bot_status.setText("⚪ Stopped")
-                if self.bot_indicator:
-                    self.bot_indicator.setText("⚪ Stopped")
-                if self.start_btn:
-                    self.start_btn.setEnabled(self.controller.is_connected)
-                if self.stop_btn:
-                    self.stop_btn.setEnabled(False)
-                if self.manual_buy_btn:
-                    self.manual_buy_btn.setEnabled(False)
-                if self.manual_sell_btn:
-                    self.manual_sell_btn.setEnabled(False)
+                self.apply_ui_state('CONNECTED' if self.controller.is_connected else 'DISCONNECTED')
 
         except Exception as e:
             print(f"Bot status update error: {e}")
 
+    def apply_ui_state(self, state):
+        """Switch buttons to a BUTTON_STATES entry - only flags that differ are touched"""
+        if state == self._ui_state:
+            return
+        current = self.BUTTON_STATES.get(self._ui_state, {})
+        for name, enabled in self.BUTTON_STATES[state].items():
+            if current.get(name) != enabled:
+                button = getattr(self, name, None)
+                if button is not None:
+                    button.setEnabled(enabled)
+        self._ui_state = state
+
     def check_symbol_warning(self):
         """Check dan tampilkan warning untuk non-XAU symbols"""
         try:
@@ -1380,25 +1761,51 @@ class MainWindow(QMainWindow):
         except Exception as e:
             print(f"Symbol warning check error: {e}")
 
+    def mark_dirty(self, key, text):
+        """Queue a label text change - unchanged text is dropped, changes flush in one batch"""
+        if self._values.get(key) != text:
+            self._values[key] = text
+            self._dirty.add(key)
+            if not self._flush_pending:
+                self._flush_pending = True
+                QTimer.singleShot(0, self._flush_dirty)
+
+    def _flush_dirty(self):
+        """Apply queued label changes"""
+        self._flush_pending = False
+        field_map = self._field_map
+        values = self._values
+        for key in self._dirty:
+            label = field_map.get(key)
+            if label is not None:
+                label.setText(values[key])
+        self._dirty.clear()
+
+    def set_style(self, label, style):
+        """Apply a label style sheet only when it differs from the last one"""
+        if self._label_styles.get(label) != style:
+            self._label_styles[label] = style
+            label.setStyleSheet(style)
+
     def update_gui_data(self):
         """Update GUI data periodically"""
         try:
             # Update daily stats
-            if hasattr(self.controller, 'daily_trades'):
-                self.daily_trades_label.setText(str(self.controller.daily_trades))
-                self.daily_pnl_label.setText(f"${self.controller.daily_pnl:.2f}")
-                self.consecutive_losses_label.setText(str(self.controller.consecutive_losses))
+            controller = self.controller
+            self.mark_dirty('daily_trades', str(controller.daily_trades))
+            self.mark_dirty('daily_pnl', self.FMT_MONEY(controller.daily_pnl))
+            self.mark_dirty('consecutive_losses', str(controller.consecutive_losses))
 
-            # Update session status
-            if hasattr(self.controller.analysis_worker, 'is_trading_session'):
-                session_ok = self.controller.analysis_worker.is_trading_session()
-                self.session_status.setText("✅ Active" if session_ok else "❌ Closed")
-                self.session_status.setStyleSheet(f"QLabel {{ color: {'green' if session_ok else 'red'}; }}")
+            # Update session status (the worker exists once connected)
+            if controller.analysis_worker is not None:
+                session_ok = controller.analysis_worker.is_trading_session()
+                self.mark_dirty('session_status', "✅ Active" if session_ok else "❌ Closed")
+                self.set_style(self.session_status, Styles.GREEN_TEXT if session_ok else Styles.RED_TEXT)
 
             # Update risk status
-            risk_ok = self.controller.check_risk_limits() if hasattr(self.controller, 'check_risk_limits') else True
-            self.risk_status.setText("✅ OK" if risk_ok else "❌ Limit Hit")
-            self.risk_status.setStyleSheet(f"QLabel {{ color: {'green' if risk_ok else 'red'}; }}")
+            risk_ok = controller.check_risk_limits()
+            self.mark_dirty('risk_status', "✅ OK" if risk_ok else "❌ Limit Hit")
+            self.set_style(self.risk_status, Styles.GREEN_TEXT if risk_ok else Styles.RED_TEXT)
 
         except Exception as e:
             pass  # Silent fail untuk GUI updates
\ No newline at end of file
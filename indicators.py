@@ -6,18 +6,139 @@ All calculation errors resolved
 
 import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 from typing import Union, List
 
+# Optional compiled kernels - the vectorized NumPy paths are used without numba.
+# nogil: the kernels run on AnalysisWorker's thread and must not stall the GUI thread
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Optional C rolling-window reductions - sliding_window_view is used without bottleneck
+try:
+    import bottleneck as bn
+    BOTTLENECK_AVAILABLE = True
+except ImportError:
+    BOTTLENECK_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, nogil=True)
+    def _smooth_kernel(values, alpha, seed, out):
+        """Sequential y[i] = alpha * x[i] + (1 - alpha) * y[i-1] into out"""
+        decay = 1.0 - alpha
+        prev = seed
+        for i in range(values.shape[0]):
+            prev = alpha * values[i] + decay * prev
+            out[i] = prev
+
+    @njit(cache=True, nogil=True)
+    def _rsi_kernel(gains, losses, period, avg_gain, avg_loss, epsilon, out):
+        """Wilder-smoothed RSI for gains/losses into out, one value per sample"""
+        for i in range(gains.shape[0]):
+            avg_gain = (avg_gain * (period - 1) + gains[i]) / period
+            avg_loss = (avg_loss * (period - 1) + losses[i]) / period
+            if avg_loss > epsilon:
+                out[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+            else:
+                out[i] = 100.0
+
+    @njit(cache=True, nogil=True)
+    def _atr_kernel(high, low, close, period, out):
+        """True range and Wilder-smoothed ATR in one pass into out (out[:period-1] untouched)"""
+        tr_sum = 0.0
+        atr = 0.0
+        for i in range(high.shape[0]):
+            tr = high[i] - low[i]
+            if i > 0:
+                tr = max(tr, abs(high[i] - close[i - 1]), abs(low[i] - close[i - 1]))
+            if i < period:
+                tr_sum += tr
+                if i == period - 1:
+                    atr = tr_sum / period
+                    out[i] = atr
+            else:
+                atr += (tr - atr) / period
+                out[i] = atr
+
+    @njit(cache=True, nogil=True)
+    def _rolling_extreme_kernel(values, period, sign, out):
+        """Rolling min (sign=1) or max (sign=-1) of each full window into out via a monotonic deque"""
+        candidates = np.empty(values.shape[0], dtype=np.int64)
+        head = 0
+        tail = 0
+        for i in range(values.shape[0]):
+            # Drop candidates that can no longer be the extreme once values[i] is in the window
+            while tail > head and sign * values[candidates[tail - 1]] >= sign * values[i]:
+                tail -= 1
+            candidates[tail] = i
+            tail += 1
+            if candidates[head] <= i - period:
+                head += 1
+            if i >= period - 1:
+                out[i - period + 1] = values[candidates[head]]
+
 class TechnicalIndicators:
     """Professional technical indicators with error-free calculations"""
 
     def __init__(self):
         self.epsilon = 1e-10  # Small value to prevent division by zero
 
+    def _as_array(self, data: Union[List, np.ndarray]) -> np.ndarray:
+        """C-contiguous float64 view of data - copies only when the input is not already one"""
+        return np.ascontiguousarray(data, dtype=np.float64)
+
+    def _rolling_min(self, values: np.ndarray, period: int) -> np.ndarray:
+        """Minimum of each full window, one value per window (len(values) - period + 1)"""
+        if BOTTLENECK_AVAILABLE:
+            return bn.move_min(values, period)[period - 1:]
+        if NUMBA_AVAILABLE:
+            out = np.empty(len(values) - period + 1)
+            _rolling_extreme_kernel(values, period, 1.0, out)
+            return out
+        return sliding_window_view(values, period).min(axis=-1)
+
+    def _rolling_max(self, values: np.ndarray, period: int) -> np.ndarray:
+        """Maximum of each full window, one value per window (len(values) - period + 1)"""
+        if BOTTLENECK_AVAILABLE:
+            return bn.move_max(values, period)[period - 1:]
+        if NUMBA_AVAILABLE:
+            out = np.empty(len(values) - period + 1)
+            _rolling_extreme_kernel(values, period, -1.0, out)
+            return out
+        return sliding_window_view(values, period).max(axis=-1)
+
+    def _recursive_smooth(self, values: np.ndarray, alpha: float, seed: float) -> np.ndarray:
+        """Vectorized y[i] = alpha * x[i] + (1 - alpha) * y[i-1], starting from y[-1] = seed"""
+        if NUMBA_AVAILABLE:
+            result = np.empty(len(values))
+            _smooth_kernel(np.ascontiguousarray(values, dtype=np.float64), float(alpha), float(seed), result)
+            return result
+
+        decay = 1.0 - alpha
+        if decay <= 0.0:
+            return np.array(values, dtype=float)
+
+        # Closed form per block: y[k] = d^(k+1)*prev + alpha * d^k * cumsum(x[j] / d^j).
+        # Block length keeps d^-k below 1e150 so the scaled cumsum cannot overflow.
+        block = max(1, int(150.0 / -np.log10(decay)))
+        result = np.empty(len(values))
+        prev = seed
+        for start in range(0, len(values), block):
+            chunk = values[start:start + block]
+            steps = np.arange(len(chunk))
+            decay_pow = decay ** steps
+            smoothed = decay_pow * (decay * prev + alpha * np.cumsum(chunk / decay_pow))
+            result[start:start + len(chunk)] = smoothed
+            prev = smoothed[-1]
+        return result
+
     def ema(self, data: Union[List, np.ndarray], period: int) -> np.ndarray:
         """Enhanced Exponential Moving Average with error handling"""
         try:
-            data = np.array(data, dtype=float)
+            data = self._as_array(data)
             
             if len(data) < period:
                 return np.full(len(data), np.nan)
@@ -32,8 +153,7 @@ class TechnicalIndicators:
             ema_values[period-1] = np.mean(data[:period])
             
             # Calculate EMA for remaining values
-            for i in range(period, len(data)):
-                ema_values[i] = (alpha * data[i]) + ((1 - alpha) * ema_values[i-1])
+            ema_values[period:] = self._recursive_smooth(data[period:], alpha, ema_values[period-1])
             
             return ema_values
 
@@ -44,16 +164,26 @@ class TechnicalIndicators:
     def sma(self, data: Union[List, np.ndarray], period: int) -> np.ndarray:
         """Simple Moving Average with proper error handling"""
         try:
-            data = np.array(data, dtype=float)
+            data = self._as_array(data)
             
             if len(data) < period:
                 return np.full(len(data), np.nan)
 
+            if BOTTLENECK_AVAILABLE:
+                return bn.move_mean(data, period)
+
             sma_values = np.full(len(data), np.nan)
-            
-            for i in range(period - 1, len(data)):
-                sma_values[i] = np.mean(data[i - period + 1:i + 1])
-            
+
+            # Rolling sum via prefix sums - window i is csum[i+1] - csum[i+1-period]
+            nan_mask = np.isnan(data)
+            csum = np.concatenate(([0.0], np.cumsum(np.where(nan_mask, 0.0, data))))
+            sma_values[period - 1:] = (csum[period:] - csum[:-period]) / period
+
+            # Windows containing a NaN stay NaN (as np.mean would give)
+            if nan_mask.any():
+                nan_count = np.concatenate(([0], np.cumsum(nan_mask)))
+                sma_values[period - 1:][(nan_count[period:] - nan_count[:-period]) > 0] = np.nan
+
             return sma_values
 
         except Exception as e:
@@ -63,7 +193,7 @@ class TechnicalIndicators:
     def rsi(self, data: Union[List, np.ndarray], period: int = 14) -> np.ndarray:
         """Enhanced RSI calculation with fixed array bounds"""
         try:
-            data = np.array(data, dtype=float)
+            data = self._as_array(data)
             
             if len(data) < period + 1:
                 return np.full(len(data), 50.0)  # Return neutral RSI
@@ -71,9 +201,9 @@ class TechnicalIndicators:
             # Calculate price changes
             delta = np.diff(data)
             
-            # Separate gains and losses
-            gains = np.where(delta > 0, delta, 0)
-            losses = np.where(delta < 0, -delta, 0)
+            # Separate gains and losses (branchless) - losses reuse the delta buffer
+            gains = np.maximum(delta, 0.0)
+            losses = np.maximum(np.negative(delta, out=delta), 0.0, out=delta)
             
             # Initialize RSI array
             rsi_values = np.full(len(data), np.nan)
@@ -89,18 +219,17 @@ class TechnicalIndicators:
             else:
                 rsi_values[period] = 100
 
-            # Calculate remaining RSI values using smoothed averages
-            for i in range(period + 1, len(data)):
-                idx = i - 1  # Index for gains/losses array
-                if idx < len(gains) and idx < len(losses):
-                    avg_gain = ((avg_gain * (period - 1)) + gains[idx]) / period
-                    avg_loss = ((avg_loss * (period - 1)) + losses[idx]) / period
-                    
-                    if avg_loss > self.epsilon:
-                        rs = avg_gain / avg_loss
-                        rsi_values[i] = 100 - (100 / (1 + rs))
-                    else:
-                        rsi_values[i] = 100
+            # Calculate remaining RSI values using smoothed averages (Wilder, alpha = 1/period)
+            if NUMBA_AVAILABLE:
+                _rsi_kernel(gains[period:], losses[period:], period, avg_gain, avg_loss,
+                            self.epsilon, rsi_values[period + 1:])
+                return rsi_values
+
+            avg_gains = self._recursive_smooth(gains[period:], 1.0 / period, avg_gain)
+            avg_losses = self._recursive_smooth(losses[period:], 1.0 / period, avg_loss)
+            has_loss = avg_losses > self.epsilon
+            rs = avg_gains / np.where(has_loss, avg_losses, 1.0)
+            rsi_values[period + 1:] = np.where(has_loss, 100 - (100 / (1 + rs)), 100)
 
             return rsi_values
 
@@ -112,9 +241,9 @@ class TechnicalIndicators:
             close: Union[List, np.ndarray], period: int = 14) -> np.ndarray:
         """Enhanced Average True Range with proper error handling"""
         try:
-            high = np.array(high, dtype=float)
-            low = np.array(low, dtype=float)
-            close = np.array(close, dtype=float)
+            high = self._as_array(high)
+            low = self._as_array(low)
+            close = self._as_array(close)
             
             # Validate input arrays
             if len(high) != len(low) or len(low) != len(close):
@@ -124,27 +253,28 @@ class TechnicalIndicators:
             if len(close) < period + 1:
                 return np.full(len(close), 0.01)
 
-            # Calculate True Range
-            tr1 = high - low
-            tr2 = np.abs(high - np.roll(close, 1))
-            tr3 = np.abs(low - np.roll(close, 1))
-            
-            # Set first value to high - low (no previous close)
-            tr2[0] = tr1[0]
-            tr3[0] = tr1[0]
-            
-            true_range = np.maximum(tr1, np.maximum(tr2, tr3))
-            
             # Calculate ATR using RMA (same as EMA with period multiplier)
             atr_values = np.full(len(close), np.nan)
+
+            if NUMBA_AVAILABLE:
+                _atr_kernel(high, low, close, period, atr_values)
+                return atr_values
+
+            # Calculate True Range in place - first bar has no previous close, so it stays high - low
+            true_range = high - low
+            prev_close = close[:-1]
+            tail = true_range[1:]
+            gap = np.subtract(high[1:], prev_close)  # one scratch array for both gaps
+            np.maximum(tail, np.abs(gap, out=gap), out=tail)
+            np.subtract(low[1:], prev_close, out=gap)
+            np.maximum(tail, np.abs(gap, out=gap), out=tail)
             
             # First ATR value is SMA of true range
             atr_values[period - 1] = np.mean(true_range[:period])
             
             # Calculate remaining ATR values
             alpha = 1.0 / period
-            for i in range(period, len(close)):
-                atr_values[i] = (alpha * true_range[i]) + ((1 - alpha) * atr_values[i - 1])
+            atr_values[period:] = self._recursive_smooth(true_range[period:], alpha, atr_values[period - 1])
             
             return atr_values
 
@@ -152,11 +282,46 @@ class TechnicalIndicators:
             print(f"ATR calculation error: {e}")
             return np.full(len(close), 0.01)
 
+    def rsi_averages(self, data: Union[List, np.ndarray], period: int = 14) -> tuple:
+        """Final Wilder (avg_gain, avg_loss) of data - the state rsi_step continues from"""
+        data = self._as_array(data)
+        delta = np.diff(data)
+        gains = np.maximum(delta, 0.0)
+        losses = np.maximum(np.negative(delta, out=delta), 0.0, out=delta)
+
+        avg_gain = np.mean(gains[:period])
+        avg_loss = np.mean(losses[:period])
+        if len(gains) > period:
+            avg_gain = self._recursive_smooth(gains[period:], 1.0 / period, avg_gain)[-1]
+            avg_loss = self._recursive_smooth(losses[period:], 1.0 / period, avg_loss)[-1]
+        return float(avg_gain), float(avg_loss)
+
+    def ema_step(self, prev_ema: float, value: float, period: int) -> float:
+        """EMA one bar on from prev_ema"""
+        alpha = 2.0 / (period + 1)
+        return alpha * value + (1.0 - alpha) * prev_ema
+
+    def rsi_step(self, avg_gain: float, avg_loss: float, prev_close: float,
+                 close: float, period: int = 14) -> float:
+        """RSI one bar on from the Wilder averages returned by rsi_averages"""
+        delta = close - prev_close
+        avg_gain = (avg_gain * (period - 1) + max(delta, 0.0)) / period
+        avg_loss = (avg_loss * (period - 1) + max(-delta, 0.0)) / period
+        if avg_loss > self.epsilon:
+            return 100 - (100 / (1 + avg_gain / avg_loss))
+        return 100.0
+
+    def atr_step(self, prev_atr: float, prev_close: float, high: float,
+                 low: float, period: int = 14) -> float:
+        """ATR one bar on from prev_atr"""
+        true_range = max(high - low, abs(high - prev_close), abs(low - prev_close))
+        return prev_atr + (true_range - prev_atr) / period
+
     def bollinger_bands(self, data: Union[List, np.ndarray], period: int = 20, 
                        std_dev: float = 2) -> tuple:
         """Bollinger Bands calculation"""
         try:
-            data = np.array(data, dtype=float)
+            data = self._as_array(data)
             
             if len(data) < period:
                 return (np.full(len(data), np.nan), 
@@ -164,11 +329,12 @@ class TechnicalIndicators:
                        np.full(len(data), np.nan))
 
             middle = self.sma(data, period)
-            std = np.full(len(data), np.nan)
-            
-            for i in range(period - 1, len(data)):
-                std[i] = np.std(data[i - period + 1:i + 1])
-            
+            if BOTTLENECK_AVAILABLE:
+                std = bn.move_std(data, period)
+            else:
+                std = np.full(len(data), np.nan)
+                std[period - 1:] = sliding_window_view(data, period).std(axis=-1)
+
             upper = middle + (std * std_dev)
             lower = middle - (std * std_dev)
             
@@ -184,7 +350,7 @@ class TechnicalIndicators:
              slow: int = 26, signal: int = 9) -> tuple:
         """MACD calculation"""
         try:
-            data = np.array(data, dtype=float)
+            data = self._as_array(data)
             
             if len(data) < slow:
                 return (np.full(len(data), np.nan), 
@@ -195,12 +361,11 @@ class TechnicalIndicators:
             ema_slow = self.ema(data, slow)
             
             macd_line = ema_fast - ema_slow
-            signal_line = self.ema(macd_line[~np.isnan(macd_line)], signal)
-            
-            # Align signal line with macd line
+
+            # Signal EMA over the warmed-up tail of the MACD line - a view, no mask copy
+            first = max(fast, slow) - 1
             aligned_signal = np.full(len(data), np.nan)
-            signal_start = len(data) - len(signal_line)
-            aligned_signal[signal_start:] = signal_line
+            aligned_signal[first:] = self.ema(macd_line[first:], signal)
             
             histogram = macd_line - aligned_signal
             
@@ -217,9 +382,9 @@ class TechnicalIndicators:
                    smooth_k: int = 3, smooth_d: int = 3) -> tuple:
         """Stochastic Oscillator calculation"""
         try:
-            high = np.array(high, dtype=float)
-            low = np.array(low, dtype=float)
-            close = np.array(close, dtype=float)
+            high = self._as_array(high)
+            low = self._as_array(low)
+            close = self._as_array(close)
             
             if len(high) != len(low) or len(low) != len(close):
                 return (np.full(len(close), np.nan), 
@@ -230,16 +395,16 @@ class TechnicalIndicators:
                        np.full(len(close), np.nan))
 
             k_percent = np.full(len(close), np.nan)
-            
-            for i in range(period - 1, len(close)):
-                lowest_low = np.min(low[i - period + 1:i + 1])
-                highest_high = np.max(high[i - period + 1:i + 1])
-                
-                if highest_high - lowest_low > self.epsilon:
-                    k_percent[i] = ((close[i] - lowest_low) / 
-                                   (highest_high - lowest_low)) * 100
-                else:
-                    k_percent[i] = 50
+
+            # Rolling extremes without a Python loop
+            lowest_low = self._rolling_min(low, period)
+            highest_high = self._rolling_max(high, period)
+            price_range = highest_high - lowest_low
+            has_range = price_range > self.epsilon
+            k_percent[period - 1:] = np.where(
+                has_range,
+                (close[period - 1:] - lowest_low) / np.where(has_range, price_range, 1.0) * 100,
+                50)
 
             k_smooth = self.sma(k_percent, smooth_k)
             d_smooth = self.sma(k_smooth, smooth_d)
@@ -255,9 +420,9 @@ class TechnicalIndicators:
                    close: Union[List, np.ndarray], period: int = 14) -> np.ndarray:
         """Williams %R calculation"""
         try:
-            high = np.array(high, dtype=float)
-            low = np.array(low, dtype=float)
-            close = np.array(close, dtype=float)
+            high = self._as_array(high)
+            low = self._as_array(low)
+            close = self._as_array(close)
             
             if len(high) != len(low) or len(low) != len(close):
                 return np.full(len(close), -50.0)
@@ -266,16 +431,16 @@ class TechnicalIndicators:
                 return np.full(len(close), -50.0)
 
             williams_r = np.full(len(close), np.nan)
-            
-            for i in range(period - 1, len(close)):
-                highest_high = np.max(high[i - period + 1:i + 1])
-                lowest_low = np.min(low[i - period + 1:i + 1])
-                
-                if highest_high - lowest_low > self.epsilon:
-                    williams_r[i] = ((highest_high - close[i]) / 
-                                    (highest_high - lowest_low)) * -100
-                else:
-                    williams_r[i] = -50
+
+            # Rolling extremes without a Python loop
+            highest_high = self._rolling_max(high, period)
+            lowest_low = self._rolling_min(low, period)
+            price_range = highest_high - lowest_low
+            has_range = price_range > self.epsilon
+            williams_r[period - 1:] = np.where(
+                has_range,
+                (highest_high - close[period - 1:]) / np.where(has_range, price_range, 1.0) * -100,
+                -50)
 
             return williams_r
 
@@ -286,16 +451,14 @@ class TechnicalIndicators:
     def momentum(self, data: Union[List, np.ndarray], period: int = 10) -> np.ndarray:
         """Momentum calculation"""
         try:
-            data = np.array(data, dtype=float)
+            data = self._as_array(data)
             
             if len(data) < period:
                 return np.full(len(data), 0.0)
 
             momentum_values = np.full(len(data), np.nan)
-            
-            for i in range(period, len(data)):
-                momentum_values[i] = data[i] - data[i - period]
-            
+            momentum_values[period:] = data[period:] - data[:len(data) - period]
+
             return momentum_values
 
         except Exception as e:
@@ -305,20 +468,20 @@ class TechnicalIndicators:
     def roc(self, data: Union[List, np.ndarray], period: int = 10) -> np.ndarray:
         """Rate of Change calculation"""
         try:
-            data = np.array(data, dtype=float)
+            data = self._as_array(data)
             
             if len(data) < period:
                 return np.full(len(data), 0.0)
 
             roc_values = np.full(len(data), np.nan)
-            
-            for i in range(period, len(data)):
-                if data[i - period] > self.epsilon:
-                    roc_values[i] = ((data[i] - data[i - period]) / 
-                                    data[i - period]) * 100
-                else:
-                    roc_values[i] = 0.0
-            
+
+            previous = data[:len(data) - period]
+            valid = previous > self.epsilon
+            roc_values[period:] = np.where(
+                valid,
+                (data[period:] - previous) / np.where(valid, previous, 1.0) * 100,
+                0.0)
+
             return roc_values
 
         except Exception as e:
@@ -328,7 +491,7 @@ class TechnicalIndicators:
     def validate_data(self, data: Union[List, np.ndarray]) -> bool:
         """Validate input data"""
         try:
-            data = np.array(data, dtype=float)
+            data = self._as_array(data)
             return len(data) > 0 and not np.all(np.isnan(data))
         except:
             return False
@@ -336,15 +499,19 @@ class TechnicalIndicators:
     def get_latest_value(self, values: np.ndarray, default: float = 0.0) -> float:
         """Safely get the latest non-NaN value"""
         try:
-            if len(values) == 0:
-                return default
-            
-            # Get last non-NaN value
-            non_nan_values = values[~np.isnan(values)]
-            if len(non_nan_values) > 0:
-                return float(non_nan_values[-1])
-            else:
+            n = len(values)
+            if n == 0:
                 return default
+
+            # Scan back from the tail - the last value is almost always already valid
+            for i in range(n - 1, max(-1, n - 33), -1):
+                value = values[i]
+                if value == value:  # not NaN
+                    return float(value)
+
+            # Long NaN tail: locate the last valid index without copying the values
+            valid = np.flatnonzero(~np.isnan(values))
+            return float(values[valid[-1]]) if valid.size else default
                 
         except Exception as e:
             print(f"Get latest value error: {e}")
@@ -353,16 +520,15 @@ class TechnicalIndicators:
     def smooth_data(self, data: Union[List, np.ndarray], window: int = 3) -> np.ndarray:
         """Apply smoothing to data"""
         try:
-            data = np.array(data, dtype=float)
+            data = self._as_array(data)
             
             if len(data) < window:
                 return data
             
+            # Leading values are kept as-is (the first window-average replaces index window onward)
             smoothed = np.copy(data)
-            
-            for i in range(window, len(data)):
-                smoothed[i] = np.mean(data[i - window + 1:i + 1])
-            
+            smoothed[window:] = self.sma(data, window)[window:]
+
             return smoothed
 
         except Exception as e:
@@ -37,6 +37,11 @@ import sys
 import os
 from pathlib import Path
 import logging
+import logging.handlers
+import queue
+import atexit
+import threading
+import time
 import traceback
 from datetime import datetime
 import numpy as np
@@ -51,6 +56,47 @@ from PySide6.QtCore import Qt
 from controller import BotController
 from gui import MainWindow
 
+# Background writer for the log handlers - see setup_logging / shutdown_logging
+_log_listener = None
+
+class BufferedFileHandler(logging.FileHandler):
+    """FileHandler with a block buffer - flushed on ERROR, every FLUSH_INTERVAL seconds and on close"""
+
+    FLUSH_INTERVAL = 1.0
+    BUFFER_SIZE = 65536
+
+    def __init__(self, filename, mode='a', encoding=None):
+        super().__init__(filename, mode=mode, encoding=encoding)
+        self._last_flush = time.monotonic()
+        self._stopped = threading.Event()
+        threading.Thread(target=self._flush_loop, name="log-flush", daemon=True).start()
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.BUFFER_SIZE,
+                    encoding=self.encoding, errors=self.errors)
+
+    def emit(self, record):
+        # StreamHandler.emit flushes every record - write into the buffer and flush on our schedule
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+            now = time.monotonic()
+            if record.levelno >= logging.ERROR or now - self._last_flush >= self.FLUSH_INTERVAL:
+                self.stream.flush()
+                self._last_flush = now
+        except Exception:
+            self.handleError(record)
+
+    def _flush_loop(self):
+        """Push out buffered records when logging goes quiet"""
+        while not self._stopped.wait(self.FLUSH_INTERVAL):
+            self.flush()
+
+    def close(self):
+        self._stopped.set()
+        super().close()
+
 def setup_logging():
     """Configure comprehensive logging dengan Windows console fix"""
     log_dir = Path("logs")
@@ -72,8 +118,8 @@ def setup_logging():
         datefmt='%Y-%m-%d %H:%M:%S'
     )
 
-    # File handler
-    file_handler = logging.FileHandler(
+    # File handler (buffered - see BufferedFileHandler)
+    file_handler = BufferedFileHandler(
         log_dir / 'scalping_bot.log', 
         encoding='utf-8', 
         mode='a'
@@ -86,14 +132,28 @@ def setup_logging():
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(log_formatter)
 
-    # Root logger configuration
+    # Root logger only enqueues records; one listener thread does the file/console writes
+    global _log_listener
+    log_queue = queue.Queue(-1)
+    _log_listener = logging.handlers.QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    _log_listener.start()
+    atexit.register(shutdown_logging)
+
     logger = logging.getLogger()
     logger.setLevel(logging.INFO)
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
 
     return logging.getLogger(__name__)
 
+def shutdown_logging():
+    """Drain queued log records and stop the listener thread (safe to call twice)"""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
 def validate_production_environment():
     """Validate production environment requirements"""
     validation_results = []
@@ -254,6 +314,7 @@ def main():
 
 if __name__ == "__main__":
     exit_code = main()
+    shutdown_logging()
 
     print("\n" + "=" * 60)
     print("FIXED MT5 SCALPING BOT - SHUTDOWN")